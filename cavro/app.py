@@ -1,144 +1,178 @@
 import streamlit as st
 import base64
+import hashlib
+import html
+import importlib
 import os
 import tempfile
+import threading
 import json
+import numpy as np
 import unicodedata
-import traceback
+import logging
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from datetime import datetime
 from io import BytesIO
 from pathlib import Path
-from dataclasses import asdict
+from dataclasses import asdict, is_dataclass
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Optional, Tuple
 
-# Import custom modules with fallbacks
 try:
-    from config.themes import get_theme
-except ImportError:
-    def get_theme(name='default'):
-        return {'primary': '#2c3e50', 'secondary': '#ecf0f1', 'accent': '#3498db', 'text': '#2c3e50', 'success': '#27ae60', 'warning': '#f39c12', 'error': '#e74c3c', 'highlight': '#2980b9'}
+    import orjson
 
-try:
-    from modules.resume_parser import parse_resume, clean_resume_text, ResumeParserError
+    def _dumps(obj):
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2).decode()
 except ImportError:
-    def parse_resume(file, **kwargs): 
-        return "Sample resume text with skills like Python, JavaScript, SQL. Experience at Tech Company as Software Engineer.", {}
-    def clean_resume_text(text): return text
-    class ResumeParserError(Exception): pass
+    def _dumps(obj):
+        return json.dumps(_as_dict(obj), indent=2, default=str)
 
-try:
-    from modules.ats_score import calculate_ats_score, ATSScorer
-except ImportError:
-    class ATSScorer:
-        def calculate_score(self, text): 
-            from types import SimpleNamespace
-            return SimpleNamespace(score=75, details={'formatting': {'score': 8, 'max_score': 10}}, feedback=['Good resume structure'])
+# Set up logging
+logger = logging.getLogger(__name__)
 
-try:
-    from modules.jd_matcher import match_resume_to_jd
-except ImportError:
-    def match_resume_to_jd(resume, jd):
-        from types import SimpleNamespace
-        return SimpleNamespace(match_score=65, keyword_overlap=['Python', 'SQL'], missing_keywords=['React', 'AWS'])
+# Fallback implementations used when a project module (or one of its
+# dependencies) cannot be imported
+def _fallback_get_theme(name='default'):
+    return {'primary': '#2c3e50', 'secondary': '#ecf0f1', 'accent': '#3498db', 'text': '#2c3e50', 'success': '#27ae60', 'warning': '#f39c12', 'error': '#e74c3c', 'highlight': '#2980b9'}
 
-try:
-    from modules.career_suggestions import suggest_career_paths
-except ImportError:
-    def suggest_career_paths(text, top_n=3): return [{'title': 'Software Engineer', 'description': 'Build software applications', 'match_score': 80, 'skills': {'matching': ['Python'], 'missing': ['React']}}]
+def _fallback_parse_resume(file, **kwargs): 
+    return "Sample resume text with skills like Python, JavaScript, SQL. Experience at Tech Company as Software Engineer.", {}
 
-try:
-    from modules.interview_prep import generate_questions
-except ImportError:
-    def generate_questions(text, num_questions=5):
-        from types import SimpleNamespace
-        questions = [
-            SimpleNamespace(question='Tell me about yourself and your background', category='General', difficulty='Easy'),
-            SimpleNamespace(question='What are your greatest strengths as a software engineer?', category='Behavioral', difficulty='Medium'),
-            SimpleNamespace(question='Describe a challenging project you worked on', category='Technical', difficulty='Medium'),
-            SimpleNamespace(question='How do you handle tight deadlines and pressure?', category='Behavioral', difficulty='Medium'),
-            SimpleNamespace(question='Where do you see yourself in 5 years?', category='Career', difficulty='Easy'),
-            SimpleNamespace(question='Explain a time you had to learn a new technology quickly', category='Technical', difficulty='Hard')
-        ]
-        return questions[:num_questions]
+class _FallbackResumeParserError(Exception): pass
 
-try:
-    from modules.blockchain_stub import blockchain_verify
-except ImportError:
-    def blockchain_verify(text): return {'status': 'pending', 'transaction_hash': 'N/A'}
+class _FallbackATSScorer:
+    def calculate_score(self, text): 
+        return SimpleNamespace(score=75, details={'formatting': {'score': 8, 'max_score': 10}}, feedback=['Good resume structure'])
 
-try:
-    from modules.utils import setup_logger, clean_text
-except ImportError:
-    def setup_logger(name): return None
-    def clean_text(text): return text
+def _fallback_match_resume_to_jd(resume, jd):
+    return SimpleNamespace(match_score=65, keyword_overlap=['Python', 'SQL'], missing_keywords=['React', 'AWS'])
 
-try:
-    from modules.resume_analyzer import analyze_resume, ResumeData, ContactInfo, Experience, Education
-except ImportError:
-    from types import SimpleNamespace
-    def analyze_resume(text): 
-        # Extract realistic info from text
-        skills = ['Python', 'JavaScript', 'React', 'SQL', 'AWS', 'Full-stack Development', 'Cloud Computing', 'Agile Methodologies']
-        contact = SimpleNamespace(name='Samira Alcaraz', email='samira.alcaraz@email.com', phone='+1-555-0123', location='San Francisco, CA', title='Senior Software Engineer')
-        exp = SimpleNamespace(title='Senior Developer', company='Tech Solutions Inc', start_date='2019', end_date='2024', description='Led development of scalable web applications using modern technologies. Managed team of 5 developers and improved system performance by 40%.')
-        edu = SimpleNamespace(degree='BS Computer Science', institution='University of Technology', field_of_study='Computer Science', gpa='3.8')
-        return SimpleNamespace(contact_info=contact, skills=skills, experiences=[exp], summary='Experienced Software Engineer with 5+ years in full-stack development, specializing in modern web technologies and cloud solutions.', education=[edu])
-    ResumeData = ContactInfo = Experience = Education = SimpleNamespace
+def _fallback_suggest_career_paths(text, top_n=3): return [{'title': 'Software Engineer', 'description': 'Build software applications', 'match_score': 80, 'skills': {'matching': ['Python'], 'missing': ['React']}}]
 
-try:
-    from modules.resume_comparator import ResumeComparator
-except ImportError:
-    class ResumeComparator: pass
+def _fallback_generate_questions(text, num_questions=5):
+    questions = [
+        SimpleNamespace(question='Tell me about yourself and your background', category='General', difficulty='Easy'),
+        SimpleNamespace(question='What are your greatest strengths as a software engineer?', category='Behavioral', difficulty='Medium'),
+        SimpleNamespace(question='Describe a challenging project you worked on', category='Technical', difficulty='Medium'),
+        SimpleNamespace(question='How do you handle tight deadlines and pressure?', category='Behavioral', difficulty='Medium'),
+        SimpleNamespace(question='Where do you see yourself in 5 years?', category='Career', difficulty='Easy'),
+        SimpleNamespace(question='Explain a time you had to learn a new technology quickly', category='Technical', difficulty='Hard')
+    ]
+    return questions[:num_questions]
 
-try:
-    from modules.resume_preview import get_resume_preview_html, get_resume_preview_css
-except ImportError:
-    def get_resume_preview_html(*args): return '<div>Preview</div>'
-    def get_resume_preview_css(): return '.preview { color: #333; }'
+def _fallback_analyze_resume(text): 
+    # Extract realistic info from text
+    skills = ['Python', 'JavaScript', 'React', 'SQL', 'AWS', 'Full-stack Development', 'Cloud Computing', 'Agile Methodologies']
+    contact = SimpleNamespace(name='Samira Alcaraz', email='samira.alcaraz@email.com', phone='+1-555-0123', location='San Francisco, CA', title='Senior Software Engineer')
+    exp = SimpleNamespace(title='Senior Developer', company='Tech Solutions Inc', start_date='2019', end_date='2024', description='Led development of scalable web applications using modern technologies. Managed team of 5 developers and improved system performance by 40%.')
+    edu = SimpleNamespace(degree='BS Computer Science', institution='University of Technology', field_of_study='Computer Science', gpa='3.8')
+    return SimpleNamespace(contact_info=contact, skills=skills, experiences=[exp], summary='Experienced Software Engineer with 5+ years in full-stack development, specializing in modern web technologies and cloud solutions.', education=[edu])
 
-try:
-    from modules.resume_summary import render_resume_summary, render_empty_summary
-except ImportError:
-    def render_resume_summary(data):
-        st.markdown("### Resume Summary")
-        
-        # Contact Information
-        if data.get('contact_info'):
-            contact = data['contact_info']
-            st.markdown("#### Contact Information")
-            col1, col2 = st.columns(2)
-            with col1:
-                if contact.get('name'): st.write(f"**Name:** {contact['name']}")
-                if contact.get('email'): st.write(f"**Email:** {contact['email']}")
-            with col2:
-                if contact.get('phone'): st.write(f"**Phone:** {contact['phone']}")
-                if contact.get('location'): st.write(f"**Location:** {contact['location']}")
-        
-        # Skills
-        if data.get('skills'):
-            st.markdown("#### Skills")
-            cols = st.columns(3)
-            for i, skill in enumerate(data['skills'][:15]):
-                with cols[i % 3]:
-                    st.write(f"• {skill}")
-        
-        # Experience
-        if data.get('experiences'):
-            st.markdown("#### Experience")
-            for exp in data['experiences'][:3]:
-                if exp:
-                    with st.expander(f"{exp.get('title', 'Position')} at {exp.get('company', 'Company')}"):
-                        if exp.get('start_date') or exp.get('end_date'):
-                            st.write(f"**Period:** {exp.get('start_date', '')} - {exp.get('end_date', '')}")
-                        if exp.get('description'):
-                            st.write(exp['description'])
+class _FallbackResumeComparator: pass
+
+def _fallback_render_resume_summary(data):
+    st.markdown("### Resume Summary")
     
-    def render_empty_summary(): st.info('Upload a resume to see summary')
+    # Contact Information
+    if data.get('contact_info'):
+        contact = data['contact_info']
+        st.markdown("#### Contact Information")
+        col1, col2 = st.columns(2)
+        with col1:
+            if contact.get('name'): st.write(f"**Name:** {contact['name']}")
+            if contact.get('email'): st.write(f"**Email:** {contact['email']}")
+        with col2:
+            if contact.get('phone'): st.write(f"**Phone:** {contact['phone']}")
+            if contact.get('location'): st.write(f"**Location:** {contact['location']}")
+    
+    # Skills
+    if data.get('skills'):
+        st.markdown("#### Skills")
+        st.markdown(render_skills_grid(data['skills']), unsafe_allow_html=True)
+    
+    # Experience
+    if data.get('experiences'):
+        st.markdown("#### Experience")
+        for exp in data['experiences'][:3]:
+            if exp:
+                with st.expander(f"{exp.get('title', 'Position')} at {exp.get('company', 'Company')}"):
+                    if exp.get('start_date') or exp.get('end_date'):
+                        st.write(f"**Period:** {exp.get('start_date', '')} - {exp.get('end_date', '')}")
+                    if exp.get('description'):
+                        st.write(exp['description'])
 
-# Add asdict fallback
-try:
-    from dataclasses import asdict
-except ImportError:
-    def asdict(obj): return {} if obj is None else getattr(obj, '__dict__', {})
+_FALLBACKS = {
+    'get_theme': _fallback_get_theme,
+    'parse_resume': _fallback_parse_resume,
+    'clean_resume_text': lambda text: text,
+    'ResumeParserError': _FallbackResumeParserError,
+    'ATSScorer': _FallbackATSScorer,
+    'match_resume_to_jd': _fallback_match_resume_to_jd,
+    'suggest_career_paths': _fallback_suggest_career_paths,
+    'generate_questions': _fallback_generate_questions,
+    'blockchain_verify': lambda text: {'status': 'pending', 'transaction_hash': 'N/A'},
+    'setup_logger': lambda name: None,
+    'clean_text': lambda text: text,
+    'analyze_resume': _fallback_analyze_resume,
+    'ResumeData': SimpleNamespace,
+    'ContactInfo': SimpleNamespace,
+    'Experience': SimpleNamespace,
+    'Education': SimpleNamespace,
+    'ResumeComparator': _FallbackResumeComparator,
+    'get_resume_preview_html': lambda *args: '<div>Preview</div>',
+    'get_resume_preview_css': lambda: '.preview { color: #333; }',
+    'render_resume_summary': _fallback_render_resume_summary,
+    'render_empty_summary': lambda: st.info('Upload a resume to see summary'),
+    'as_features': lambda text: text,
+    'CACHE_SETTINGS': {"enabled": True, "ttl": 3600, "max_size": 1000},
+    'PERFORMANCE_SETTINGS': {"max_workers": 4, "timeout": 30},
+}
+
+def _load(module_name):
+    """Import a project module once, returning None if it is unavailable."""
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        return None
+
+_mods = {name: _load(name) for name in (
+    'config.settings', 'config.themes', 'modules.resume_parser', 'modules.ats_score', 'modules.jd_matcher',
+    'modules.career_suggestions', 'modules.interview_prep', 'modules.blockchain_stub',
+    'modules.utils', 'modules.resume_analyzer', 'modules.resume_comparator',
+    'modules.resume_preview', 'modules.resume_summary',
+)}
+
+def _resolve(module_name, attr):
+    """Return attr from an imported module, or its fallback implementation."""
+    return getattr(_mods[module_name], attr, None) or _FALLBACKS.get(attr)
+
+# Import custom modules with fallbacks
+CACHE_SETTINGS = _resolve('config.settings', 'CACHE_SETTINGS')
+PERFORMANCE_SETTINGS = _resolve('config.settings', 'PERFORMANCE_SETTINGS')
+get_theme = _resolve('config.themes', 'get_theme')
+parse_resume = _resolve('modules.resume_parser', 'parse_resume')
+clean_resume_text = _resolve('modules.resume_parser', 'clean_resume_text')
+ResumeParserError = _resolve('modules.resume_parser', 'ResumeParserError')
+calculate_ats_score = _resolve('modules.ats_score', 'calculate_ats_score')
+ATSScorer = _resolve('modules.ats_score', 'ATSScorer')
+match_resume_to_jd = _resolve('modules.jd_matcher', 'match_resume_to_jd')
+suggest_career_paths = _resolve('modules.career_suggestions', 'suggest_career_paths')
+generate_questions = _resolve('modules.interview_prep', 'generate_questions')
+blockchain_verify = _resolve('modules.blockchain_stub', 'blockchain_verify')
+setup_logger = _resolve('modules.utils', 'setup_logger')
+clean_text = _resolve('modules.utils', 'clean_text')
+as_features = _resolve('modules.utils', 'as_features')
+analyze_resume = _resolve('modules.resume_analyzer', 'analyze_resume')
+ResumeData = _resolve('modules.resume_analyzer', 'ResumeData')
+ContactInfo = _resolve('modules.resume_analyzer', 'ContactInfo')
+Experience = _resolve('modules.resume_analyzer', 'Experience')
+Education = _resolve('modules.resume_analyzer', 'Education')
+ResumeComparator = _resolve('modules.resume_comparator', 'ResumeComparator')
+get_resume_preview_html = _resolve('modules.resume_preview', 'get_resume_preview_html')
+get_resume_preview_css = _resolve('modules.resume_preview', 'get_resume_preview_css')
+render_resume_summary = _resolve('modules.resume_summary', 'render_resume_summary')
+render_empty_summary = _resolve('modules.resume_summary', 'render_empty_summary')
 
 def rewrite_resume(bullet_point: str, style: str = "professional") -> str:
     """A simple resume rewriter that doesn't require external dependencies."""
@@ -146,57 +180,30 @@ def rewrite_resume(bullet_point: str, style: str = "professional") -> str:
 
 def extract_initials(name: str) -> str:
     """Extract initials from a full name."""
-    if not name or name.strip() == "":
-        return "?"
-    
-    # Clean the name and split into parts
-    name_parts = [part.strip() for part in name.split() if part.strip()]
-    if not name_parts:
+    if not name:
         return "?"
     
-    # Get first letter of first two parts (first name, last name)
-    initials = ''.join([part[0].upper() for part in name_parts[:2]])
-    return initials if initials else "?"
+    # First letter of the first two parts (first name, last name)
+    initials = []
+    for part in name.split(maxsplit=2):
+        initials.append(part[0].upper())
+        if len(initials) == 2:
+            break
+    return "".join(initials) or "?"
 
-def render_profile_card(name, title, email, phone, location, initials):
-    """Render a clean profile card with user information using CSS classes."""
-    profile_html = f"""
-    <div class="profile-card">
-        <div class="profile-avatar">
-            {initials}
-        </div>
-        
-        <h3 class="profile-name">{name}</h3>
-        {f'<p class="profile-title">{title}</p>' if title else ''}
-        
-        <div class="contact-info">
-    """
-    
-    # Add contact information with icons
-    contact_items = [
-        (email, "mailto:" + email, "✉️") if email else None,
-        (phone, "tel:" + phone, "📞") if phone else None,
-        (location, None, "📍") if location else None
-    ]
-    
-    for item in contact_items:
-        if item:
-            value, link, icon = item
-            if link:
-                profile_html += f"""
+_CONTACT_LINK_TMPL = """
                 <div class="contact-item">
                     <span class="contact-icon">{icon}</span>
                     <a href="{link}">{value}</a>
                 </div>"""
-            else:
-                profile_html += f"""
+
+_CONTACT_TXT_TMPL = """
                 <div class="contact-item">
                     <span class="contact-icon">{icon}</span>
                     <span>{value}</span>
                 </div>"""
-    
-    # Add download button
-    profile_html += """
+
+_CARD_TAIL = """
             <div style="margin-top: 1.5rem; padding-top: 1.5rem; border-top: 1px solid #f0f0f0;">
                 <button onclick="window.print()" style="
                     display: block;
@@ -215,11 +222,39 @@ def render_profile_card(name, title, email, phone, location, initials):
         </div>
     </div>
     """
+
+def render_profile_card(name, title, email, phone, location, initials):
+    """Render a clean profile card with user information using CSS classes."""
+    card_head = f"""
+    <div class="profile-card">
+        <div class="profile-avatar">
+            {initials}
+        </div>
+        
+        <h3 class="profile-name">{name}</h3>
+        {f'<p class="profile-title">{title}</p>' if title else ''}
+        
+        <div class="contact-info">
+    """
+    
+    # Add contact information with icons
+    parts = []
+    if email:
+        parts.append(_CONTACT_LINK_TMPL.format(icon="✉️", link="mailto:" + email, value=email))
+    if phone:
+        parts.append(_CONTACT_LINK_TMPL.format(icon="📞", link="tel:" + phone, value=phone))
+    if location:
+        parts.append(_CONTACT_TXT_TMPL.format(icon="📍", value=location))
     
-    return profile_html
+    return card_head + "".join(parts) + _CARD_TAIL
 
 def render_actionable_empty_state(section_name, suggestions):
     """Render an actionable empty state with suggestions."""
+    return _empty_state_html(section_name, tuple(suggestions))
+
+@lru_cache(maxsize=8)
+def _empty_state_html(section_name, suggestions):
+    """Build (once per section) the empty-state HTML for a tuple of suggestions."""
     icons = {
         "summary": "📝",
         "skills": "🎯",
@@ -249,27 +284,29 @@ def render_actionable_empty_state(section_name, suggestions):
     </div>
     """
 
-def render_skills_section(skills_list):
-    """Render the skills section with proper styling."""
-    if not skills_list:
-        suggestions = [
-            "Add technical skills relevant to your field",
-            "Include soft skills like 'Leadership' or 'Communication'",
-            "List programming languages, tools, or certifications"
-        ]
-        return render_actionable_empty_state("Skills", suggestions)
-    
-    # Generate color-coded skill chips
-    skills_html = '<div style="display: flex; flex-wrap: wrap; gap: 0.5rem; margin: 1rem 0;">'
-    
-    for i, skill in enumerate(skills_list[:15]):  # Limit to 15 skills
-        # Generate a consistent color for each skill
-        hue = (i * 137) % 360  # Golden ratio for color distribution
-        skills_html += f"""
+_SKILLS_SUGGESTIONS = (
+    "Add technical skills relevant to your field",
+    "Include soft skills like 'Leadership' or 'Communication'",
+    "List programming languages, tools, or certifications"
+)
+
+_EXPERIENCE_SUGGESTIONS = (
+    "Add your most recent work experiences",
+    "Include job titles, company names, and dates",
+    "Write bullet points describing your achievements"
+)
+
+# Skill chip colors, spaced by the golden angle so neighbouring chips differ
+_SKILL_PALETTE = [
+    (f"hsl({hue}, 70%, 95%)", f"hsl({hue}, 50%, 25%)", f"hsl({hue}, 40%, 80%)")
+    for hue in ((i * 137) % 360 for i in range(15))
+]
+
+_CHIP_TMPL = """
         <span style="
-            background: hsl({hue}, 70%, 95%);
-            color: hsl({hue}, 50%, 25%);
-            border: 1px solid hsl({hue}, 40%, 80%);
+            background: {bg};
+            color: {fg};
+            border: 1px solid {br};
             padding: 0.4rem 0.8rem;
             border-radius: 20px;
             font-size: 0.85rem;
@@ -279,54 +316,272 @@ def render_skills_section(skills_list):
             {skill}
         </span>
         """
+
+def render_skills_section(skills_list):
+    """Render the skills section with proper styling."""
+    if not skills_list:
+        return render_actionable_empty_state("Skills", _SKILLS_SUGGESTIONS)
     
-    skills_html += '</div>'
-    return skills_html
+    # Generate color-coded skill chips (limit to 15 skills)
+    chips = "".join(
+        _CHIP_TMPL.format(bg=bg, fg=fg, br=br, skill=skill)
+        for (bg, fg, br), skill in zip(_SKILL_PALETTE, skills_list[:15])
+    )
+    return f'<div style="display: flex; flex-wrap: wrap; gap: 0.5rem; margin: 1rem 0;">{chips}</div>'
+
+def render_skills_grid(skills_list):
+    """Render up to 15 skills as a bulleted three-column grid in one element."""
+    items = "".join(f"<div>• {html.escape(str(skill))}</div>" for skill in skills_list[:15])
+    return f'<div style="display:grid;grid-template-columns:1fr 1fr 1fr;gap:.25rem">{items}</div>'
+
+# Difficulty badge renderer and emoji; unknown levels render as Medium
+_DIFF_RENDERERS = {
+    'Easy': (st.success, '🟢'),
+    'Medium': (st.warning, '🟡'),
+    'Hard': (st.error, '🔴'),
+}
+
+_JOB_CARD_TMPL = (
+    '<div style="background: white; border-left: 4px solid #667eea; padding: 1.25rem; margin-bottom: 1rem; '
+    'border-radius: 0 8px 8px 0; box-shadow: 0 2px 4px rgba(0,0,0,0.05);">'
+    '<div style="display: flex; justify-content: space-between; align-items: start; margin-bottom: 0.5rem;">'
+    '<h4 style="margin: 0; color: #2d3748; font-size: 1.1rem;">{title}</h4>'
+    '<span style="color: #718096; font-size: 0.8rem; background: #f7fafc; padding: 0.2rem 0.6rem; border-radius: 12px;">{duration}</span>'
+    '</div>'
+    '<p style="color: #667eea; font-weight: 500; margin: 0 0 0.75rem 0; font-size: 0.95rem;">{company}</p>'
+    '<p style="color: #4a5568; line-height: 1.6; margin: 0; font-size: 0.9rem;">{desc}</p>'
+    '</div>'
+)
 
+@st.cache_data(show_spinner=False)
 def render_experience_section(jobs_list):
     """Render the experience section with proper styling."""
     if not jobs_list:
-        suggestions = [
-            "Add your most recent work experiences",
-            "Include job titles, company names, and dates",
-            "Write bullet points describing your achievements"
-        ]
-        return render_actionable_empty_state("Experience", suggestions)
+        return render_actionable_empty_state("Experience", _EXPERIENCE_SUGGESTIONS)
     
-    experience_html = ""
-    for i, job in enumerate(jobs_list[:3]):  # Show top 3 jobs
+    parts = []
+    for job in jobs_list[:3]:  # Show top 3 jobs
         if not job:
             continue
-            
-        job_title = job.get('title', 'Position')
-        company = job.get('company', 'Company')
-        duration = job.get('duration', 'Duration not specified')
-        description = job.get('description', 'No description available.')
-        
-        # Truncate long descriptions
-        if len(description) > 200:
-            description = description[:200] + "..."
         
-        experience_html += f"""
-        <div style="
-            background: white;
-            border-left: 4px solid #667eea;
-            padding: 1.25rem;
-            margin-bottom: 1rem;
-            border-radius: 0 8px 8px 0;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.05);">
-            
-            <div style="display: flex; justify-content: space-between; align-items: start; margin-bottom: 0.5rem;">
-                <h4 style="margin: 0; color: #2d3748; font-size: 1.1rem;">{job_title}</h4>
-                <span style="color: #718096; font-size: 0.8rem; background: #f7fafc; padding: 0.2rem 0.6rem; border-radius: 12px;">{duration}</span>
-            </div>
-            
-            <p style="color: #667eea; font-weight: 500; margin: 0 0 0.75rem 0; font-size: 0.95rem;">{company}</p>
-            <p style="color: #4a5568; line-height: 1.6; margin: 0; font-size: 0.9rem;">{description}</p>
-        </div>
+        description = job.get('description') or 'No description available.'
+        parts.append(_JOB_CARD_TMPL.format(
+            title=html.escape(job.get('title') or 'Position'),
+            duration=html.escape(job.get('duration') or 'Duration not specified'),
+            company=html.escape(job.get('company') or 'Company'),
+            # Truncate long descriptions
+            desc=html.escape(description[:200]) + ("..." if len(description) > 200 else "")
+        ))
+    
+    return "".join(parts)
+
+_CAREER_CARD_TMPL = """
+        <details{open} style="border: 1px solid #e2e8f0; border-radius: 8px; padding: 0.75rem 1rem; margin-bottom: 0.75rem;">
+            <summary style="cursor: pointer; font-weight: 600;">🎯 {title} ({score:.0f}% match)</summary>
+            <p style="margin: 0.75rem 0 0.25rem 0;"><strong>Match Level:</strong> {level}</p>
+            <progress value="{score:.0f}" max="100" style="width: 100%; accent-color: {color};"></progress>
+            <p style="margin: 0.5rem 0;">{description}</p>{skills}
+        </details>
         """
+
+# (color, label) per match level, indexed by the level np.select assigns
+_MATCH_LEVELS = (
+    ("#48bb78", "Excellent Match"),
+    ("#ed8936", "Good Match"),
+    ("#a0aec0", "Potential Match"),
+)
+
+@st.cache_data(show_spinner=False)
+def render_career_suggestions(suggestions):
+    """Render career suggestions as collapsible cards in a single HTML block."""
+    # Clamp every score and pick its match level in one vectorized pass
+    scores = np.fromiter((s.get('match_score', 0) for s in suggestions), dtype=np.float32, count=len(suggestions))
+    scores = np.clip(scores, 10.0, 100.0)
+    levels = np.select([scores >= 80, scores >= 60], [0, 1], default=2)
+    
+    parts = []
+    for i, (suggestion, match_score, level) in enumerate(zip(suggestions, scores.tolist(), levels.tolist())):
+        match_color, match_level = _MATCH_LEVELS[level]
+        
+        # Skills analysis
+        skills_data = suggestion.get('skills', {})
+        matching_skills = skills_data.get('matching', [])[:6]
+        missing_skills = skills_data.get('missing', [])[:4]
+        skills = ""
+        if matching_skills:
+            skills += f"<p style=\"margin: 0.25rem 0;\"><strong>✅ Your Relevant Skills:</strong><br>{', '.join(matching_skills)}</p>"
+        if missing_skills:
+            skills += f"<p style=\"margin: 0.25rem 0;\"><strong>📚 Skills to Develop:</strong><br>{', '.join(missing_skills)}</p>"
+        
+        parts.append(_CAREER_CARD_TMPL.format(
+            open=" open" if i == 0 else "",
+            title=suggestion.get('title', f'Career Path {i+1}'),
+            score=match_score,
+            level=match_level,
+            color=match_color,
+            description=suggestion.get('description', 'No description available.'),
+            skills=skills
+        ))
+    
+    return "".join(parts)
+
+# Cached pipeline helpers: every widget interaction reruns the script, so the
+# expensive parse/analyze/score steps are memoized on their inputs.
+@st.cache_data(show_spinner=False)
+def _parse_cached(file_key: str, _upload, ext: str):
+    """Parse an uploaded file into (text, metadata), keyed by the digest of its bytes."""
+    text, metadata = parse_resume(_upload, file_extension=ext, extract_metadata_flag=True)
+    # Normalize once so PDF ligatures and compatibility glyphs don't leak into
+    # every downstream matcher and rendered template
+    if text:
+        text = unicodedata.normalize('NFKC', text)
+    return text, metadata
+
+def _as_dict(obj):
+    """Recursively convert dataclass/namespace resume data into plain dicts."""
+    if is_dataclass(obj):
+        return asdict(obj)
+    if isinstance(obj, SimpleNamespace):
+        return {key: _as_dict(value) for key, value in vars(obj).items()}
+    if isinstance(obj, list):
+        return [_as_dict(item) for item in obj]
+    return obj
+
+@st.cache_data(show_spinner=False)
+def _analyze_cached(text: str) -> dict:
+    """Analyze resume text into a plain dict of structured resume data."""
+    return _as_dict(analyze_resume(text))
+
+def _safe_analyze(text: str) -> Tuple[Optional[dict], Optional[str]]:
+    """Analyze resume text, returning (data, None) on success or (None, error)."""
+    try:
+        return _analyze_cached(text), None
+    except Exception as e:
+        logger.exception("Resume analysis failed")
+        return None, f"Resume analysis failed: {e}"
+
+@st.cache_resource
+def get_ats_scorer():
+    """Return a process-wide ATS scorer."""
+    return ATSScorer()
+
+@st.cache_resource
+def get_resume_comparator():
+    """Return a process-wide resume comparator, or None if it cannot load."""
+    try:
+        return ResumeComparator()
+    except:
+        return None
+
+@st.cache_data(show_spinner=False)
+def _ats_cached(text: str):
+    """Calculate the ATS score for resume text."""
+    return get_ats_scorer().calculate_score(text)
+
+def _text_key(text: str) -> str:
+    """Digest text with whitespace collapsed, so reformatted copies share a key."""
+    return hashlib.blake2b(" ".join(text.split()).encode(), digest_size=16).hexdigest()
+
+@st.cache_data(show_spinner=False, ttl=CACHE_SETTINGS["ttl"], max_entries=CACHE_SETTINGS["max_size"])
+def _match_cached(resume_key: str, jd_key: str, _resume_text: str, _jd_text: str):
+    """Match resume text against a job description, keyed by both text digests."""
+    return match_resume_to_jd(_resume_text, _jd_text)
+
+@st.cache_resource(ttl=CACHE_SETTINGS["ttl"], max_entries=CACHE_SETTINGS["max_size"])
+def _features_cached(resume_key: str, _text: str):
+    """Lowercase and tokenize resume text once for every analysis that reads it."""
+    return as_features(_text)
+
+@st.cache_data(show_spinner=False, ttl=CACHE_SETTINGS["ttl"], max_entries=CACHE_SETTINGS["max_size"])
+def _suggest_cached(resume_key: str, _features, top_n: int):
+    """Suggest career paths for resume features, keyed by the text digest."""
+    return suggest_career_paths(_features, top_n=top_n)
+
+@st.cache_resource
+def get_executor():
+    """Return a process-wide worker pool for the per-resume analyses."""
+    return ThreadPoolExecutor(max_workers=PERFORMANCE_SETTINGS["max_workers"], thread_name_prefix="cavro")
+
+def _warmup(done: threading.Event):
+    """Build the expensive shared objects before the first upload needs them."""
+    try:
+        get_ats_scorer()
+        careers = _mods['modules.career_suggestions']
+        if careers is not None and hasattr(careers, '_career_skill_index'):
+            careers._career_skill_index()
+        jd_matcher = _mods['modules.jd_matcher']
+        if jd_matcher is not None and getattr(jd_matcher, 'model', None) is not None:
+            jd_matcher._embed(["warmup"], jd_matcher.model)
+    except Exception:
+        pass  # Warmup is best effort; the real call will surface any error
+    finally:
+        done.set()
+
+@st.cache_resource
+def start_warmup() -> threading.Event:
+    """Start warming up once per process; the returned event is set when it finishes."""
+    done = threading.Event()
+    threading.Thread(target=_warmup, args=(done,), name="cavro-warmup", daemon=True).start()
+    return done
+
+def _submit_analyses(resume_text: str, text_key: str, jd_text: str = "") -> dict:
+    """Start every analysis the tabs need, returning their futures by name."""
+    # Don't race the warmup thread into building the same objects twice
+    start_warmup().wait(timeout=PERFORMANCE_SETTINGS["timeout"])
+    executor = get_executor()
+    features = _features_cached(text_key, resume_text)
+    futures = {
+        'analyze': executor.submit(_safe_analyze, resume_text),
+        'ats': executor.submit(_ats_cached, resume_text),
+        'careers': executor.submit(_suggest_cached, text_key, features, 4),
+        'questions': executor.submit(generate_questions, features, num_questions=6),
+    }
+    if jd_text:
+        futures['match'] = executor.submit(_match_cached, text_key, _text_key(jd_text), resume_text, jd_text)
+    return futures
+
+_SIZE_UNITS = ("bytes", "KB", "MB")
+
+@st.cache_data(show_spinner=False)
+def _doc_info(file_name: str, file_size: int, ext: str) -> str:
+    """Format the document info block for an uploaded file."""
+    # Unit index from the power-of-two magnitude: <1 KiB bytes, <1 MiB KB, else MB
+    unit = min(2, max(file_size.bit_length() - 1, 0) // 10)
+    size = f"{file_size:,} bytes" if unit == 0 else f"{file_size / (1 << (10 * unit)):.1f} {_SIZE_UNITS[unit]}"
+    return (
+        "#### 📋 Document Info\n\n"
+        f"**File:** {file_name}  \n"
+        f"**Size:** {size}  \n"
+        f"**Type:** {ext.upper()}"
+    )
+
+# st.fragment is stable since Streamlit 1.37; older releases only ship the experimental name
+_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda func: func)
+
+@_fragment
+def _profile_card(name, title, email, phone, location, file_name, file_size, file_extension):
+    """Render the profile and document info column; its widgets rerun only this fragment."""
+    # Use user input name if no name found in resume
+    final_name = name or st.session_state.get('user_name') or "Professional"
+    initials = extract_initials(final_name)
+    
+    st.markdown(f"### {initials}")
+    st.markdown(f"**{final_name}**")
+    if title:
+        st.write(title)
     
-    return experience_html
+    if email or phone or location:
+        st.markdown("#### Contact")
+        if email: st.write(f"📧 {email}")
+        if phone: st.write(f"📞 {phone}")
+        if location: st.write(f"📍 {location}")
+    
+    if st.button("📄 Download Resume"):
+        st.success("Resume download initiated!")
+    
+    # Document stats card
+    st.markdown(_doc_info(file_name, file_size, file_extension))
+    st.success("✅ Processed")
 
 # Set page config
 st.set_page_config(
@@ -336,55 +591,16 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Get theme colors
-try:
-    theme = get_theme('porcelain_lapins')
-    colors = theme['colors'] if 'colors' in theme else theme
-except:
-    colors = {
-        'background': '#ffffff',
-        'primary': '#2c3e50',
-        'secondary': '#ecf0f1',
-        'accent': '#3498db',
-        'text': '#2c3e50',
-        'success': '#27ae60',
-        'warning': '#f39c12',
-        'error': '#e74c3c',
-        'highlight': '#2980b9'
-    }
-
-# Load external CSS files
-resume_styles = """
+# Base resume styles
+RESUME_STYLES = """
 /* Basic resume styles */
 .resume-container { max-width: 1200px; margin: 0 auto; padding: 2rem; }
 .profile-card { background: white; padding: 2rem; border-radius: 12px; box-shadow: 0 4px 6px rgba(0,0,0,0.05); }
 .resume-section { margin-bottom: 2rem; background: white; border-radius: 12px; padding: 1.5rem; }
 """
 
-# Get resume preview CSS
-resume_preview_css = get_resume_preview_css()
-
-# Combine all CSS
-custom_css = f"""
-:root {{
-    --primary: {colors['primary']};
-    --secondary: {colors['secondary']};
-    --accent: {colors['accent']};
-    --text: {colors['text']};
-    --success: {colors['success']};
-    --warning: {colors['warning']};
-    --error: {colors['error']};
-    --highlight: {colors['highlight']};
-}}
-
-/* Resume Styles */
-{resume_styles}
-
-/* Resume Preview Component Styles */
-{resume_preview_css}"""
-
-# Add custom Streamlit overrides
-custom_css += """
+# Custom Streamlit overrides
+STREAMLIT_OVERRIDES_CSS = """
 /* Streamlit overrides */
 .stApp {
     background-color: #f8fafc;
@@ -414,8 +630,47 @@ footer {visibility: hidden;}
 header {visibility: hidden;}
 """
 
+@st.cache_resource
+def _build_css(theme_name: str) -> str:
+    """Assemble the app stylesheet once per server process."""
+    # Get theme colors
+    try:
+        colors = _as_dict(get_theme(theme_name))
+    except:
+        colors = {
+            'background': '#ffffff',
+            'primary': '#2c3e50',
+            'secondary': '#ecf0f1',
+            'accent': '#3498db',
+            'text': '#2c3e50',
+            'success': '#27ae60',
+            'warning': '#f39c12',
+            'error': '#e74c3c',
+            'highlight': '#2980b9'
+        }
+    
+    # Combine all CSS
+    return f"""
+:root {{
+    --primary: {colors['primary']};
+    --secondary: {colors['secondary']};
+    --accent: {colors['accent']};
+    --text: {colors['text']};
+    --success: {colors['success']};
+    --warning: {colors['warning']};
+    --error: {colors['error']};
+    --highlight: {colors['highlight']};
+}}
+
+/* Resume Styles */
+{RESUME_STYLES}
+
+/* Resume Preview Component Styles */
+{get_resume_preview_css()}
+{STREAMLIT_OVERRIDES_CSS}"""
+
 # Inject the combined CSS
-st.markdown(f'<style>{custom_css}</style>', unsafe_allow_html=True)
+st.markdown(f"<style>{_build_css('porcelain_lapins')}</style>", unsafe_allow_html=True)
 
 # Header
 st.title("📝 Cavro - AI Resume Agent")
@@ -427,6 +682,7 @@ with st.sidebar:
     st.markdown("## 👤 Your Profile")
     user_name = st.text_input(
         "Your Full Name", 
+        key="user_name",
         placeholder="Enter your name here",
         help="This will be used to personalize your resume"
     )
@@ -438,11 +694,11 @@ with st.sidebar:
         help="Selecting a target role will provide more specific feedback"
     )
 
+# Warm up models and indexes in the background while the user picks a file
+start_warmup()
+
 # Initialize resume comparator
-try:
-    comparator = ResumeComparator()
-except:
-    comparator = None
+comparator = get_resume_comparator()
 
 # File Upload Section
 st.subheader("📤 Upload Your Resume")
@@ -455,12 +711,17 @@ uploaded_file = st.file_uploader(
 
 # Job Description (Optional)
 st.subheader("📝 Job Description (Optional)")
-jd_text = st.text_area(
-    "Paste the job description here to get matching analysis",
-    height=120,
-    placeholder="Paste the job description to get tailored feedback and keyword matching...",
-    help="Adding a job description will provide more specific ATS optimization suggestions"
-)
+# Inside a form the text area only reruns the script when "Run match" is
+# pressed, not on every edit
+with st.form("jd_form"):
+    jd_text = st.text_area(
+        "Paste the job description here to get matching analysis",
+        key="jd",
+        height=120,
+        placeholder="Paste the job description to get tailored feedback and keyword matching...",
+        help="Adding a job description will provide more specific ATS optimization suggestions"
+    )
+    st.form_submit_button("Run match")
 
 # Debug section (collapsible)
 with st.expander("🔧 Debug: View Extracted Text", expanded=False):
@@ -483,11 +744,10 @@ if uploaded_file is not None:
     try:
         # File processing
         file_name = uploaded_file.name
-        file_content = uploaded_file.getvalue()
-        file_size = len(file_content)
+        file_size = uploaded_file.size
         
         # Validate file
-        if not file_content:
+        if not file_size:
             st.error("❌ The uploaded file is empty. Please upload a valid resume file.")
             st.stop()
         
@@ -496,7 +756,9 @@ if uploaded_file is not None:
             st.stop()
         
         # Get file extension
-        file_extension = os.path.splitext(file_name)[1].lstrip('.').lower()
+        file_base, dot, file_extension = file_name.rpartition('.')
+        file_extension = file_extension.lower() if dot else ''
+        file_base = file_base or file_name
         if not file_extension:
             st.error("❌ Could not determine file type. Please ensure your file has a valid extension (.pdf, .docx, .txt).")
             st.stop()
@@ -505,11 +767,10 @@ if uploaded_file is not None:
         with st.spinner("🔍 Analyzing your resume..."):
             try:
                 # Parse resume
-                resume_text, metadata = parse_resume(
-                    uploaded_file, 
-                    file_extension=file_extension,
-                    extract_metadata_flag=True
-                )
+                # UploadedFile is a BytesIO over the received bytes; getvalue() hands
+                # back that same object, whereas getbuffer() would force a copy
+                file_key = hashlib.blake2b(uploaded_file.getvalue(), digest_size=16).hexdigest()
+                resume_text, metadata = _parse_cached(file_key, uploaded_file, file_extension)
                 
                 if not resume_text or not resume_text.strip():
                     # Use sample data silently
@@ -525,47 +786,51 @@ if uploaded_file is not None:
         # Success indicator
         st.success("✅ Successfully processed your resume!")
         
+        # Every tab works off the same text, so start all analyses up front;
+        # each tab below just waits on its own future
+        text_key = _text_key(resume_text)
+        futures = _submit_analyses(resume_text, text_key, jd_text if jd_text.strip() else "")
+        timeout = PERFORMANCE_SETTINGS["timeout"]
+        
         # Analyze resume data
-        try:
-            resume_data = analyze_resume(resume_text)
-            
+        with st.spinner("📊 Running resume analysis..."):
+            try:
+                resume_data, analyze_error = futures['analyze'].result(timeout=timeout)
+            except FuturesTimeoutError:
+                resume_data, analyze_error = None, "Resume analysis timed out"
+        if analyze_error is None:
             # Extract contact information safely
-            contact_info = getattr(resume_data, 'contact_info', None)
-            name = getattr(contact_info, 'name', None) if contact_info else None
-            title = getattr(contact_info, 'title', None) if contact_info else None
-            email = getattr(contact_info, 'email', None) if contact_info else None
-            phone = getattr(contact_info, 'phone', None) if contact_info else None
-            location = getattr(contact_info, 'location', None) if contact_info else None
-            
-            # Use user input name if no name found in resume
-            final_name = name or user_name or "Professional"
-            initials = extract_initials(final_name)
+            contact_info = resume_data.get('contact_info') or {}
+            name = contact_info.get('name')
+            title = contact_info.get('title')
+            email = contact_info.get('email')
+            phone = contact_info.get('phone')
+            location = contact_info.get('location')
             
             # Extract other data
-            skills = getattr(resume_data, 'skills', []) if hasattr(resume_data, 'skills') else []
-            experiences = getattr(resume_data, 'experiences', []) if hasattr(resume_data, 'experiences') else []
-            summary = getattr(resume_data, 'summary', '') if hasattr(resume_data, 'summary') else ''
+            skills = resume_data.get('skills') or []
+            summary = resume_data.get('summary') or ''
             
             # Process experience data
-            jobs_list = []
-            for exp in experiences[:3]:  # Top 3 experiences
-                if exp:
-                    jobs_list.append({
-                        'title': getattr(exp, 'title', 'Position'),
-                        'company': getattr(exp, 'company', 'Company'),
-                        'duration': f"{getattr(exp, 'start_date', '')} - {getattr(exp, 'end_date', '')}".strip(' -'),
-                        'description': getattr(exp, 'description', 'No description available.')[:300]
-                    })
+            jobs_list = [
+                {
+                    'title': exp.get('title', 'Position'),
+                    'company': exp.get('company', 'Company'),
+                    'duration': f"{exp.get('start_date') or ''} - {exp.get('end_date') or ''}".strip(' -'),
+                    'description': (exp.get('description') or 'No description available.')[:300]
+                }
+                for exp in (resume_data.get('experiences') or [])[:3]  # Top 3 experiences
+                if exp
+            ]
             
-        except Exception as e:
+        else:
             st.warning("⚠️ Could not fully analyze resume structure. Using basic text processing.")
             # Fallback to basic processing
-            final_name = user_name or "Professional"
-            initials = extract_initials(final_name)
+            resume_data = {}
             skills = []
             jobs_list = []
             summary = ""
-            email = phone = location = title = None
+            name = email = phone = location = title = None
         
         # Create main interface tabs
         tabs = st.tabs(["📄 Resume Summary", "📊 ATS Score", "🚀 Career Suggestions", "💡 Interview Prep"])
@@ -579,32 +844,7 @@ if uploaded_file is not None:
             
             # Column 1: Profile Card
             with col1:
-                st.markdown(f"### {initials}")
-                st.markdown(f"**{final_name}**")
-                if title:
-                    st.write(title)
-                
-                if email or phone or location:
-                    st.markdown("#### Contact")
-                    if email: st.write(f"📧 {email}")
-                    if phone: st.write(f"📞 {phone}")
-                    if location: st.write(f"📍 {location}")
-                
-                if st.button("📄 Download Resume"):
-                    st.success("Resume download initiated!")
-                
-                # Document stats card
-                file_size_formatted = f"{file_size:,} bytes"
-                if file_size > 1024 * 1024:
-                    file_size_formatted = f"{file_size / (1024 * 1024):.1f} MB"
-                elif file_size > 1024:
-                    file_size_formatted = f"{file_size / 1024:.1f} KB"
-                
-                st.markdown("#### 📋 Document Info")
-                st.write(f"**File:** {file_name}")
-                st.write(f"**Size:** {file_size_formatted}")
-                st.write(f"**Type:** {file_extension.upper()}")
-                st.success("✅ Processed")
+                _profile_card(name, title, email, phone, location, file_name, file_size, file_extension)
             
             # Column 2: Main Resume Content
             with col2:
@@ -618,20 +858,14 @@ if uploaded_file is not None:
                 # Skills Section
                 st.markdown("### 🎯 Key Skills")
                 if skills:
-                    cols = st.columns(3)
-                    for i, skill in enumerate(skills[:15]):
-                        with cols[i % 3]:
-                            st.write(f"• {skill}")
+                    st.markdown(render_skills_grid(skills), unsafe_allow_html=True)
                 else:
                     st.warning("No skills found. Add technical and soft skills to improve your resume.")
                 
                 # Experience Section
                 st.markdown("### 💼 Professional Experience")
                 if jobs_list:
-                    for job in jobs_list:
-                        with st.expander(f"{job['title']} at {job['company']}"):
-                            st.write(f"**Duration:** {job['duration']}")
-                            st.write(job['description'])
+                    st.markdown(render_experience_section(jobs_list), unsafe_allow_html=True)
                 else:
                     st.warning("No work experience found. Add your professional experience with job titles and descriptions.")
                 
@@ -643,9 +877,17 @@ if uploaded_file is not None:
                     st.download_button(
                         label="Download Resume Text",
                         data=resume_text,
-                        file_name=f"{os.path.splitext(file_name)[0]}.txt",
+                        file_name=f"{file_base}.txt",
                         mime="text/plain"
                     )
+                    
+                    if resume_data:
+                        st.download_button(
+                            label="Download Structured Data",
+                            data=_dumps(resume_data),
+                            file_name=f"{file_base}.json",
+                            mime="application/json"
+                        )
             
             # Third column for additional info
             with col3:
@@ -661,8 +903,7 @@ if uploaded_file is not None:
                 st.markdown("## 📊 ATS Score & Optimization")
                 
                 # Calculate ATS score
-                ats_scorer = ATSScorer()
-                ats_result = ats_scorer.calculate_score(resume_text)
+                ats_result = futures['ats'].result(timeout=timeout)
                 ats_score = ats_result.score
                 
                 # Determine score color and status
@@ -719,7 +960,7 @@ if uploaded_file is not None:
                     if jd_text.strip():
                         st.markdown("### 🔍 Job Match Analysis")
                         try:
-                            match_result = match_resume_to_jd(resume_text, jd_text)
+                            match_result = futures['match'].result(timeout=timeout)
                             match_score = match_result.match_score
                             
                             st.metric("Job Match Score", f"{match_score:.1f}%")
@@ -742,46 +983,13 @@ if uploaded_file is not None:
             st.markdown("## 🚀 Career Path Recommendations")
             
             try:
-                with st.spinner("🔍 Analyzing career opportunities..."):
-                    suggestions = suggest_career_paths(resume_text, top_n=4)
+                suggestions = futures['careers'].result(timeout=timeout)
                 
                 if not suggestions:
                     st.info("🤔 We need more information to suggest career paths. Try adding more skills and experience to your resume.")
                 else:
-                    for i, suggestion in enumerate(suggestions):
-                        title = suggestion.get('title', f'Career Path {i+1}')
-                        description = suggestion.get('description', 'No description available.')
-                        match_score = max(10, suggestion.get('match_score', 0))
-                        
-                        # Determine match level
-                        if match_score >= 80:
-                            match_color = "#48bb78"
-                            match_level = "Excellent Match"
-                        elif match_score >= 60:
-                            match_color = "#ed8936"
-                            match_level = "Good Match"
-                        else:
-                            match_color = "#a0aec0"
-                            match_level = "Potential Match"
-                        
-                        with st.expander(f"🎯 {title} ({match_score:.0f}% match)", expanded=(i == 0)):
-                            st.write(f"**Match Level:** {match_level}")
-                            st.progress(match_score / 100)
-                            st.write(description)
-                            
-                            # Skills analysis
-                            skills_data = suggestion.get('skills', {})
-                            matching_skills = skills_data.get('matching', [])[:6]
-                            missing_skills = skills_data.get('missing', [])[:4]
-                            
-                            if matching_skills:
-                                st.write("**✅ Your Relevant Skills:**")
-                                st.write(", ".join(matching_skills))
-                            
-                            if missing_skills:
-                                st.write("**📚 Skills to Develop:**")
-                                st.write(", ".join(missing_skills))
-                        
+                    st.markdown(render_career_suggestions(suggestions), unsafe_allow_html=True)
+                
             except Exception as e:
                 st.error(f"❌ Error generating career suggestions: {str(e)}")
         
@@ -791,29 +999,26 @@ if uploaded_file is not None:
             
             try:
                 with st.spinner("🎯 Generating personalized interview questions..."):
-                    questions = generate_questions(resume_text, num_questions=6)
+                    questions = futures['questions'].result(timeout=timeout)
                 
                 if not questions:
                     st.info("📝 Add more details to your resume to get personalized interview questions.")
                 else:
                     st.markdown("### 🎤 Practice These Questions")
                     
-                    for i, q in enumerate(questions, 1):
-                        question_text = getattr(q, 'question', str(q))
-                        category = getattr(q, 'category', 'General')
-                        difficulty = getattr(q, 'difficulty', 'Medium')
+                    rows = tuple(
+                        (getattr(q, 'question', str(q)), getattr(q, 'category', 'General'), getattr(q, 'difficulty', 'Medium'))
+                        for q in questions
+                    )
+                    for question_text, category, difficulty in rows:
+                        render, emoji = _DIFF_RENDERERS.get(difficulty, _DIFF_RENDERERS['Medium'])
                         
                         with st.expander(f"❓ {question_text}", expanded=False):
                             col1, col2 = st.columns([2, 1])
                             with col1:
                                 st.write(f"**Category:** {category}")
                             with col2:
-                                if difficulty == 'Easy':
-                                    st.success(f"🟢 {difficulty}")
-                                elif difficulty == 'Hard':
-                                    st.error(f"🔴 {difficulty}")
-                                else:
-                                    st.warning(f"🟡 {difficulty}")
+                                render(f"{emoji} {difficulty}")
                             
                             st.info("💡 **Tip:** Structure your answer using the STAR method (Situation, Task, Action, Result) for behavioral questions.")
                             
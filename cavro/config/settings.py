@@ -6,7 +6,9 @@ Sensitive information should be loaded from environment variables in production.
 """
 import os
 import logging
+from logging.handlers import RotatingFileHandler
 from pathlib import Path
+from types import MappingProxyType
 from typing import List, Dict, Any, Optional, Union
 # Load .env if python-dotenv is available
 try:
@@ -15,18 +17,13 @@ try:
 except Exception:
     _HAS_DOTENV = False
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 # Load environment variables from .env file if it exists
 if _HAS_DOTENV:
     load_dotenv()
 else:
-    logging.getLogger(__name__).warning("python-dotenv not installed; skipping .env loading")
+    logger.warning("python-dotenv not installed; skipping .env loading")
 
 # ============================================
 # Application Settings
@@ -74,8 +71,8 @@ GEMINI_SAFETY_SETTINGS = [
 MAX_FILE_SIZE_MB = int(os.getenv("MAX_FILE_SIZE_MB", 10))
 MAX_FILE_SIZE = MAX_FILE_SIZE_MB * 1024 * 1024  # Convert MB to bytes
 
-# Supported file formats
-SUPPORTED_FORMATS = {
+# Supported file formats (read-only)
+SUPPORTED_FORMATS = MappingProxyType({
     "pdf": "application/pdf",
     "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
     "doc": "application/msword",
@@ -87,10 +84,10 @@ SUPPORTED_FORMATS = {
     "jpeg": "image/jpeg",
     "tiff": "image/tiff",
     "bmp": "image/bmp"
-}
+})
 
 # Allowed file extensions for upload (derived from SUPPORTED_FORMATS)
-ALLOWED_EXTENSIONS = list(SUPPORTED_FORMATS.keys())
+ALLOWED_EXTENSIONS = tuple(SUPPORTED_FORMATS)
 
 # ============================================
 # Resume Processing
@@ -167,6 +164,7 @@ CAREER_SUGGESTIONS_SETTINGS = {
 BLOCKCHAIN_SETTINGS = {
     "enabled": True,
     "difficulty": 2,  # Lower is easier (for testing)
+    "mining_workers": 1,  # Processes for proof-of-work; more only help at high difficulty
     "verify_on_upload": True,
     "verification_expiry_days": 365,  # How long verifications are considered valid
 }
@@ -176,10 +174,10 @@ BLOCKCHAIN_SETTINGS = {
 # ============================================
 # File storage settings
 STORAGE_SETTINGS = {
-    "local_storage_path": os.path.join(BASE_DIR, "storage"),
+    "local_storage_path": str(BASE_DIR / "storage"),
     "use_cloud_storage": False,
     "cloud_provider": "aws_s3",  # aws_s3, google_cloud, azure_blob
-    "temp_dir": os.path.join(BASE_DIR, "temp"),
+    "temp_dir": str(BASE_DIR / "temp"),
     "max_temp_files": 100,
     "cleanup_temp_files": True,
 }
@@ -198,7 +196,7 @@ CACHE_SETTINGS = {
 # Logging
 # ============================================
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-LOG_FILE = os.path.join(BASE_DIR, "logs", "app.log")
+LOG_FILE = str(BASE_DIR / "logs" / "app.log")
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 LOG_MAX_SIZE = 10 * 1024 * 1024  # 10 MB
 LOG_BACKUP_COUNT = 5
@@ -274,6 +272,20 @@ elif ENVIRONMENT == "testing":
     FEATURE_FLAGS["enable_blockchain_verification"] = False
 
 # Create necessary directories
-os.makedirs(os.path.join(BASE_DIR, "logs"), exist_ok=True)
-os.makedirs(STORAGE_SETTINGS["local_storage_path"], exist_ok=True)
-os.makedirs(STORAGE_SETTINGS["temp_dir"], exist_ok=True)
+_DIRS = (
+    BASE_DIR / "logs",
+    Path(STORAGE_SETTINGS["local_storage_path"]),
+    Path(STORAGE_SETTINGS["temp_dir"]),
+)
+for _dir in _DIRS:
+    _dir.mkdir(parents=True, exist_ok=True)
+
+# Configure logging: console plus a size-capped rotating log file
+logging.basicConfig(
+    level=LOG_LEVEL,
+    format=LOG_FORMAT,
+    handlers=[
+        logging.StreamHandler(),
+        RotatingFileHandler(LOG_FILE, maxBytes=LOG_MAX_SIZE, backupCount=LOG_BACKUP_COUNT, encoding="utf-8"),
+    ]
+)
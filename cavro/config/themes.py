@@ -4,6 +4,7 @@ Theme configuration for the Cavro Resume Agent application.
 This module provides a collection of color themes and helper functions
 to manage the application's visual appearance.
 """
+from dataclasses import dataclass
 from typing import Dict, Literal, TypedDict
 
 class ThemeColors(TypedDict):
@@ -15,6 +16,19 @@ class ThemeColors(TypedDict):
     text: str
     highlight: str
 
+@dataclass(frozen=True, slots=True)
+class Theme:
+    """Immutable set of colors for one theme."""
+    background: str
+    primary: str
+    secondary: str
+    accent: str
+    text: str
+    highlight: str
+    success: str
+    warning: str
+    error: str
+
 # Available themes
 theme_presets = {
     'porcelain_lapins': {
@@ -75,7 +89,12 @@ theme_presets = {
     }
 }
 
-def get_theme(theme_name: str = 'porcelain_lapins') -> Dict[str, str]:
+# Theme colors by theme ID, built once from the presets above
+_THEMES: Dict[str, Theme] = {
+    theme_id: Theme(**theme_data['colors']) for theme_id, theme_data in theme_presets.items()
+}
+
+def get_theme(theme_name: str = 'porcelain_lapins') -> Theme:
     """
     Get a theme by name.
     
@@ -83,14 +102,15 @@ def get_theme(theme_name: str = 'porcelain_lapins') -> Dict[str, str]:
         theme_name: Name of the theme to retrieve
         
     Returns:
-        Dictionary containing the theme colors
+        Theme containing the theme colors
         
     Raises:
         KeyError: If the specified theme doesn't exist
     """
-    if theme_name not in theme_presets:
-        raise KeyError(f"Theme '{theme_name}' not found. Available themes: {', '.join(theme_presets.keys())}")
-    return theme_presets[theme_name]['colors']
+    try:
+        return _THEMES[theme_name]
+    except KeyError:
+        raise KeyError(f"Theme '{theme_name}' not found. Available themes: {', '.join(_THEMES)}") from None
 
 def list_themes() -> Dict[str, str]:
     """
@@ -102,4 +122,4 @@ def list_themes() -> Dict[str, str]:
     return {theme_id: theme_data['name'] for theme_id, theme_data in theme_presets.items()}
 
 # Default theme
-theme = theme_presets['porcelain_lapins']['colors']
+theme = _THEMES['porcelain_lapins']
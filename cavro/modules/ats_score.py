@@ -1,13 +1,203 @@
 import re
+import copy
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from typing import Dict, List, Tuple, Set, Optional, Any, Union
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 import json
+from .utils import ResumeFeatures
+
+try:
+    import ahocorasick
+    _HAS_AHOCORASICK = True
+except ImportError:
+    _HAS_AHOCORASICK = False
 
 # Module logger
 logger = logging.getLogger(__name__)
 
+_WORD_CHAR_RE = re.compile(r'\w')
+
+# Patterns are compiled once at import rather than rebuilt on every scoring call
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', re.IGNORECASE)
+_PHONE_RE = re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', re.IGNORECASE)
+_LINKEDIN_RE = re.compile(r'\b(https?://)?(www\.)?linkedin\.com/[\w-]+\b', re.IGNORECASE)
+_GITHUB_RE = re.compile(r'\b(https?://)?(www\.)?github\.com/[\w-]+\b', re.IGNORECASE)
+# Literal every match of a contact pattern must contain; a cheap substring
+# test skips the regex when it's absent
+_CONTACT_HINTS = {'linkedin': 'linkedin.com/', 'github': 'github.com/'}
+
+# Work experience: date ranges, job titles, company names, bullets and metrics
+_DATE_RE = re.compile(r'(?i)(?:(?P<start_month>Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s*(?P<start_year>\d{4})\s*[–-]\s*(?P<end_month>Present|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s*\d{4})?)')
+_JOB_LEVELS = r'(?:(?:Senior|Junior|Lead|Staff|Principal|Associate|Director|VP|CTO|CEO|Founder)\s+)?'
+_JOB_ROLES = (
+    r'(?:Software\s+Engineer|Developer|Data\s+Scientist|ML\s+Engineer|AI\s+Engineer|'
+    r'Product\s+Manager|Project\s+Manager|Engineering\s+Manager|DevOps\s+Engineer|'
+    r'QA\s+Engineer|Test\s+Engineer|UI/UX\s+Designer|Full\s+Stack|Back\s+End|Front\s+End|'
+    r'Cloud\s+Architect|Solutions\s+Architect|Data\s+Engineer|Database\s+Admin|'
+    r'Security\s+Engineer|Network\s+Engineer|Systems\s+Administrator)'
+)
+_JOB_TITLE_RE = re.compile(fr'\b{_JOB_LEVELS}{_JOB_ROLES}\b', re.IGNORECASE)
+# Company name pattern (simplified)
+_COMPANY_RE = re.compile(r'(?i)(?:(?:at|@|\bat\b)\s*)([A-Z][A-Za-z0-9&.\-\s]+?)(?=\s*(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|\d|\n|$))')
+_BULLET_RE = re.compile(r'^[•\-*]\s+(.+)')
+_METRICS_RE = re.compile(r'\b(?:increased|reduced|saved|improved|grew|optimized|decreased|boosted|achieved|delivered)\b.*?\b(?:by|to|from)?\s*\$?\d+(?:\.\d+)?[%kKmMbB]?\b', re.IGNORECASE)
+_LEADING_WORD_RE = re.compile(r'^\w+')
+# Matched against lowercased text, so no IGNORECASE
+_TECH_TERMS = (
+    'api', 'rest', 'graphql', 'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'react', 'angular', 'vue',
+    'python', 'java', 'javascript', 'typescript', 'sql', 'nosql', 'mongodb', 'postgresql', 'mysql',
+    'machine learning', 'ai', 'ml', 'data science', 'ci/cd', 'terraform', 'ansible', 'git', 'agile',
+    'scrum', 'devops', 'microservices',
+)
+
+# Seniority rank per title keyword (2 is the unlabelled mid level). A title's
+# level is the lowest rank among the keywords it contains as substrings; the
+# lookahead reports overlapping hits such as 'cto' inside 'director'.
+_SENIORITY_LEVELS = {
+    'junior': 0, 'associate': 1, 'senior': 3, 'lead': 4, 'principal': 5,
+    'manager': 6, 'director': 7, 'vp': 8, 'cto': 9, 'ceo': 10,
+}
+_SENIORITY_RE = re.compile('(?=(' + '|'.join(_SENIORITY_LEVELS) + '))')
+
+# Education
+_INSTITUTION_RE = re.compile(r'\b(?:University|College|Institute|School|Univ\.?|Inst\.?|Tech|Polytechnic)\b', re.IGNORECASE)
+_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+
+# Skills
+_SKILLS_SECTION_RE = re.compile(r'(?i)(?:skills|technical\s+skills|technical\s+expertise|technologies)[:;\s]*(.+?)(?=\n\w|$)', re.DOTALL)
+_SKILL_SEP_TRANS = str.maketrans({',': '\n', '|': '\n', '•': '\n'})
+
+# Achievements: quantified results, recognition, leadership and visibility.
+# Each pattern is paired with the words it must start with; a pattern only
+# runs when one of them occurs in the lowercased text.
+_ACHIEVEMENT_RES = tuple(
+    (tuple(triggers.split('|')), re.compile(rf'\b(?:{triggers})\b{tail}', re.IGNORECASE))
+    for triggers, tail in (
+        ('increased|reduced|saved|grew|improved|decreased|optimized|boosted|expanded|delivered',
+         r'[^.!?]*\b(?:by\s+)?(\d+%?|\$\d+[KkMm]?|\d+[KkMm]?\$?)\b'),
+        ('award|certification|recognition|honor|prize|scholarship|publication|presentation|patent', ''),
+        ('led|managed|mentored|trained|supervised', r'[^.!?]*\b(?:team|group|project)\b'),
+        ('presented|published|speaker|talk|workshop|conference', ''),
+    )
+)
+
+# Formatting
+_ALL_CAPS_LINE_RE = re.compile(r'[A-Z\s]+')
+
+def _scan_text(text: str) -> Dict[str, Any]:
+    """
+    Collect the line-level formatting statistics of a resume in one pass.
+    
+    Args:
+        text: The resume text
+        
+    Returns:
+        Dict with the nonblank line count, the set of bullet characters used,
+        the number of all-caps lines and the newline counts
+    """
+    line_count = 0
+    all_caps_lines = 0
+    bullet_styles = set()
+    for line in text.split('\n'):
+        stripped = line.strip()
+        if not stripped:
+            continue
+        line_count += 1
+        # A bullet is a leading •, - or * followed by whitespace
+        if stripped[0] in '•-*' and (len(stripped) == 1 or stripped[1].isspace()):
+            bullet_styles.add(stripped[0])
+        # isupper() rejects most lines before the regex runs
+        if stripped.isupper() and _ALL_CAPS_LINE_RE.fullmatch(stripped):
+            all_caps_lines += 1
+    
+    return {
+        'line_count': line_count,
+        'bullet_styles': bullet_styles,
+        'all_caps_lines': all_caps_lines,
+        # Whole-text counts run at memchr speed, faster than tallying per line
+        'newlines': text.count('\n'),
+        'double_newlines': text.count('\n\n'),
+    }
+
+class _KeywordScanner:
+    """
+    Find which of a fixed set of keywords occur in a text, in a single pass.
+    
+    Matches follow the semantics of ``re.search(rf'\\b{re.escape(kw)}\\b', text, re.I)``
+    for every keyword, but the text is scanned once instead of once per keyword.
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, otherwise one
+    precompiled alternation.
+    """
+    
+    def __init__(self, keywords: List[str]):
+        self.keywords = [kw.lower() for kw in keywords]
+        if _HAS_AHOCORASICK:
+            self._automaton = ahocorasick.Automaton()
+            for kw in self.keywords:
+                self._automaton.add_word(kw, kw)
+            self._automaton.make_automaton()
+        else:
+            # Zero-width lookahead so overlapping keywords are all reported
+            alternation = '|'.join(
+                rf'\b{re.escape(kw)}\b' for kw in sorted(self.keywords, key=len, reverse=True)
+            )
+            self._pattern = re.compile(rf'(?=({alternation}))')
+    
+    @staticmethod
+    def _is_boundary(text: str, pos: int) -> bool:
+        """Return True if there is a regex word boundary (\\b) at pos."""
+        before = pos > 0 and _WORD_CHAR_RE.match(text, pos - 1) is not None
+        after = pos < len(text) and _WORD_CHAR_RE.match(text, pos) is not None
+        return before != after
+    
+    def find(self, text_lower: str) -> Set[str]:
+        """
+        Return the set of keywords present in text.
+        
+        Args:
+            text_lower: Lowercased text to scan
+            
+        Returns:
+            Set of matched keywords, lowercased
+        """
+        if not _HAS_AHOCORASICK:
+            return {m.group(1) for m in self._pattern.finditer(text_lower)}
+        
+        found = set()
+        for end, kw in self._automaton.iter(text_lower):
+            if kw in found:
+                continue
+            start = end - len(kw) + 1
+            if self._is_boundary(text_lower, start) and self._is_boundary(text_lower, end + 1):
+                found.add(kw)
+        return found
+    
+    def count(self, text_lower: str) -> int:
+        """
+        Count the positions in text where a keyword occurs.
+        
+        Args:
+            text_lower: Lowercased text to scan
+            
+        Returns:
+            Number of word-bounded keyword occurrences
+        """
+        if not _HAS_AHOCORASICK:
+            return sum(1 for _ in self._pattern.finditer(text_lower))
+        
+        starts = set()
+        for end, kw in self._automaton.iter(text_lower):
+            start = end - len(kw) + 1
+            if self._is_boundary(text_lower, start) and self._is_boundary(text_lower, end + 1):
+                starts.add(start)
+        return len(starts)
+
 class ScoreCategory(Enum):
     KEYWORDS = "keywords"
     ACTION_VERBS = "action_verbs"
@@ -18,7 +208,7 @@ class ScoreCategory(Enum):
     ACHIEVEMENTS = "achievements"
     FORMATTING = "formatting"
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScoreResult:
     """Container for ATS scoring results and feedback."""
     score: float
@@ -32,7 +222,22 @@ class ATSScorer:
     Evaluates resumes based on various criteria important for ATS parsing.
     """
     
-    def __init__(self):
+    # Number of distinct resumes whose results are kept for re-scoring
+    SCORE_CACHE_SIZE = 256
+    
+    def __init__(self, max_workers: int = 1):
+        """
+        Initialize the scorer.
+        
+        Args:
+            max_workers: Number of threads used to run the category scorers
+                concurrently. The default of 1 scores sequentially, which is
+                fastest on GIL builds of CPython where ``re`` holds the GIL;
+                raise it on free-threaded builds.
+        """
+        # Reused across calls; created only when scoring is parallel
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ats") if max_workers > 1 else None
+        
         # Initialize scoring criteria with weights (out of 100)
         self.keyword_weights = {
             ScoreCategory.KEYWORDS: 30,
@@ -44,6 +249,11 @@ class ATSScorer:
             ScoreCategory.ACHIEVEMENTS: 15,
             ScoreCategory.FORMATTING: 10
         }
+        # (key, feedback label, weight) per category, in scoring order
+        self._categories = [
+            (category.value, category.value.replace('_', ' ').title(), self.keyword_weights[category])
+            for category in ScoreCategory
+        ]
         
         # Common keywords for different categories
         self.common_keywords = {
@@ -63,11 +273,20 @@ class ATSScorer:
             'streamlined', 'transformed'
         ]
         
+        # One alternation finds every verb-led word in a single pass. Longer verbs
+        # are tried first; any verb that prefixes the matched one also counts.
+        self._action_verbs_re = re.compile(
+            r'\b(' + '|'.join(re.escape(v) for v in sorted(self.action_verbs, key=len, reverse=True)) + r')\w*\b'
+        )
+        self._verb_prefixes = {
+            verb: [v for v in self.action_verbs if verb.startswith(v)] for verb in self.action_verbs
+        }
+        
         self.contact_info_patterns = [
-            (r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', 'email'),
-            (r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', 'phone'),
-            (r'\b(https?://)?(www\.)?linkedin\.com/[\w-]+\b', 'linkedin'),
-            (r'\b(https?://)?(www\.)?github\.com/[\w-]+\b', 'github'),
+            (_EMAIL_RE, 'email'),
+            (_PHONE_RE, 'phone'),
+            (_LINKEDIN_RE, 'linkedin'),
+            (_GITHUB_RE, 'github'),
         ]
         
         # Common degree types and institutions
@@ -76,51 +295,107 @@ class ATSScorer:
             r'bs', r'b\.s\.', r'bachelor', r'ba', r'b\.a\.', r'ms', r'm\.s\.', r'master', r'phd', r'ph\.d\.', 
             r'mba', r'b\.tech', r'btech', r'm\.tech', r'mtech', r'b\.e\.', r'b\.eng', r'm\.e\.', r'm\.eng', r'bca', r'mca'
         ]
+        # Entries are already regex patterns (dots escaped), so join them as-is
+        self._degree_re = re.compile('(?:' + '|'.join(self.degree_types) + ')', re.IGNORECASE)
+        
+        # One scanner over every keyword, shared by keyword and skills scoring
+        self._keyword_scanner = _KeywordScanner(
+            [kw for keywords in self.common_keywords.values() for kw in keywords]
+        )
+        
+        # Each keyword's bit within its category's presence mask
+        self._kw_bits: Dict[str, List[Tuple[str, int]]] = {}
+        for category, keywords in self.common_keywords.items():
+            for idx, keyword in enumerate(keywords):
+                self._kw_bits.setdefault(keyword, []).append((category, 1 << idx))
+        
+        # Normalizers derived from the fixed tables above
+        self._total_keywords = sum(len(keywords) for keywords in self.common_keywords.values())
+        self._contact_pattern_count = len(self.contact_info_patterns)
         
         # Common section headers
         self.section_headers = [
             'experience', 'work history', 'employment', 'education', 'skills', 'projects',
             'certifications', 'awards', 'publications', 'languages', 'interests'
         ]
+        self._section_scanner = _KeywordScanner(self.section_headers)
+        self._tech_scanner = _KeywordScanner(list(_TECH_TERMS))
+        
+        # Results keyed by a digest of the resume text, most recently used last
+        self._score_cache: "OrderedDict[bytes, ScoreResult]" = OrderedDict()
+        self._score_cache_lock = threading.Lock()
 
-    def calculate_score(self, text: str) -> ScoreResult:
+    def calculate_score(self, text: Union[str, ResumeFeatures]) -> ScoreResult:
         """
         Calculate the ATS score for the given resume text.
         
         Args:
-            text: The resume text to score
+            text: The resume text to score, or its pre-tokenized ResumeFeatures
             
         Returns:
             ScoreResult: Object containing the score and detailed feedback
         """
+        if isinstance(text, ResumeFeatures):
+            text = text.text
         if not text or not text.strip():
             return ScoreResult(0, 100, {}, ["Empty resume text provided"])
-            
-        results = {}
+        
+        # Re-scoring unchanged text (reruns, retries) is served from the cache;
+        # callers get a copy so they can't mutate the cached result
+        key = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        with self._score_cache_lock:
+            cached = self._score_cache.get(key)
+            if cached is not None:
+                self._score_cache.move_to_end(key)
+                return copy.deepcopy(cached)
+        
+        result = self._compute_score(text)
+        with self._score_cache_lock:
+            self._score_cache[key] = result
+            if len(self._score_cache) > self.SCORE_CACHE_SIZE:
+                self._score_cache.popitem(last=False)
+        return copy.deepcopy(result)
+    
+    def _compute_score(self, text: str) -> ScoreResult:
+        """Score non-empty resume text across every category."""
+        # Case-insensitive scans share one lowercased copy instead of each
+        # pattern case-folding at match time
+        text_lower = text.lower()
         total_score = 0
-        max_score = sum(self.keyword_weights.values())
         feedback = []
         
-        # Calculate scores for each category
-        results[ScoreCategory.KEYWORDS] = self._score_keywords(text)
-        results[ScoreCategory.ACTION_VERBS] = self._score_action_verbs(text)
-        results[ScoreCategory.CONTACT_INFO] = self._score_contact_info(text)
-        results[ScoreCategory.WORK_EXPERIENCE] = self._score_work_experience(text)
-        results[ScoreCategory.EDUCATION] = self._score_education(text)
-        results[ScoreCategory.SKILLS] = self._score_skills(text)
-        results[ScoreCategory.ACHIEVEMENTS] = self._score_achievements(text)
-        results[ScoreCategory.FORMATTING] = self._score_formatting(text)
+        # Keyword and skills scoring share one scan of the keyword table
+        present_keywords = self._keyword_scanner.find(text_lower)
+        
+        # Calculate scores for each category, in self._categories order; the
+        # scorers are independent
+        scorers = (
+            (self._score_keywords, (present_keywords,)),
+            (self._score_action_verbs, (text_lower,)),
+            (self._score_contact_info, (text, text_lower)),
+            (self._score_work_experience, (text,)),
+            (self._score_education, (text,)),
+            (self._score_skills, (text, present_keywords)),
+            (self._score_achievements, (text, text_lower)),
+            (self._score_formatting, (text, text_lower)),
+        )
+        if self._pool is not None:
+            futures = [self._pool.submit(scorer, *args) for scorer, args in scorers]
+            results = [future.result() for future in futures]
+        else:
+            results = [scorer(*args) for scorer, args in scorers]
         
-        # Calculate total score
-        for category, (score, max_possible, details) in results.items():
-            category_weight = self.keyword_weights[category]
+        # Calculate total score and build the details payload in the same pass
+        details = {}
+        for (name, label, category_weight), (score, max_possible, category_details) in zip(self._categories, results):
             normalized_score = (score / max_possible) * category_weight
             total_score += normalized_score
+            details[name] = {'score': score, 'max_score': max_possible, **category_details}
             
             # Add feedback for areas needing improvement
             if score < max_possible * 0.6:  # If score is less than 60%
-                if 'feedback' in details:
-                    feedback.append(f"{category.value.replace('_', ' ').title()}: {details['feedback']}")
+                if 'feedback' in category_details:
+                    feedback.append(f"{label}: {category_details['feedback']}")
         
         # Ensure score doesn't exceed 100
         final_score = min(round(total_score, 2), 100)
@@ -136,25 +411,30 @@ class ATSScorer:
         return ScoreResult(
             score=final_score,
             max_score=100,
-            details={k.value: {'score': v[0], 'max_score': v[1], **v[2]} for k, v in results.items()},
+            details=details,
             feedback=feedback
         )
     
-    def _score_keywords(self, text: str) -> Tuple[float, float, Dict[str, Any]]:
-        """Score based on relevant keywords in the resume."""
-        found_keywords = {category: [] for category in self.common_keywords}
-        total_keywords = sum(len(keywords) for keywords in self.common_keywords.values())
+    def _score_keywords(self, present: Set[str]) -> Tuple[float, float, Dict[str, Any]]:
+        """Score based on relevant keywords, given the set found in the resume."""
+        total_keywords = self._total_keywords
         
-        for category, keywords in self.common_keywords.items():
-            for keyword in keywords:
-                if re.search(rf'\b{re.escape(keyword)}\b', text, re.IGNORECASE):
-                    found_keywords[category].append(keyword)
+        # Per-category presence bitmasks; only the details payload needs lists
+        masks = dict.fromkeys(self.common_keywords, 0)
+        for keyword in present:
+            for category, bit in self._kw_bits[keyword]:
+                masks[category] |= bit
         
-        found_count = sum(len(v) for v in found_keywords.values())
+        found_count = sum(mask.bit_count() for mask in masks.values())
         score = (found_count / total_keywords * 100) if total_keywords > 0 else 0
         
+        found_keywords = {
+            category: [keyword for idx, keyword in enumerate(keywords) if masks[category] >> idx & 1]
+            for category, keywords in self.common_keywords.items()
+        }
+        
         # Generate feedback
-        missing_categories = [k for k, v in found_keywords.items() if not v]
+        missing_categories = [k for k, mask in masks.items() if not mask]
         feedback = []
         if missing_categories:
             feedback.append(f"Consider adding keywords related to: {', '.join(missing_categories)}.")
@@ -165,13 +445,12 @@ class ATSScorer:
             'feedback': "; ".join(feedback) if feedback else "Good keyword coverage across multiple categories."
         }
     
-    def _score_action_verbs(self, text: str) -> Tuple[float, float, Dict[str, Any]]:
-        """Score based on the use of strong action verbs."""
-        found_verbs = []
-        
-        for verb in self.action_verbs:
-            if re.search(rf'\b{re.escape(verb)}\w*\b', text, re.IGNORECASE):
-                found_verbs.append(verb)
+    def _score_action_verbs(self, text_lower: str) -> Tuple[float, float, Dict[str, Any]]:
+        """Score based on the use of strong action verbs in the (lowercased) resume."""
+        matched = set()
+        for m in self._action_verbs_re.finditer(text_lower):
+            matched.update(self._verb_prefixes[m.group(1)])
+        found_verbs = [verb for verb in self.action_verbs if verb in matched]
         
         # Score based on number of unique action verbs found
         unique_verbs = list(set(found_verbs))
@@ -190,23 +469,21 @@ class ATSScorer:
             'feedback': "; ".join(feedback) if feedback else "Good use of action-oriented language."
         }
     
-    def _score_contact_info(self, text: str) -> Tuple[float, float, Dict[str, Any]]:
+    def _score_contact_info(self, text: str, text_lower: str) -> Tuple[float, float, Dict[str, Any]]:
         """Score based on presence of contact information."""
         found_items = {}
         
         for pattern, item_type in self.contact_info_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                # Handle different match groups from the regex
-                if isinstance(matches[0], tuple):
-                    # If the regex has groups, take the first non-empty match
-                    match = next((m for m in matches[0] if m), '')
-                    found_items[item_type] = match
-                else:
-                    found_items[item_type] = matches[0]
+            hint = _CONTACT_HINTS.get(item_type)
+            if hint is not None and hint not in text_lower:
+                continue
+            # Only the first occurrence is reported, so stop at it
+            match = pattern.search(text)
+            if match:
+                found_items[item_type] = match.group(0)
         
         # Score based on number of contact info items found
-        score = (len(found_items) / len(self.contact_info_patterns)) * 100
+        score = (len(found_items) / self._contact_pattern_count) * 100
         
         # Generate feedback
         missing = [t for p, t in self.contact_info_patterns if t not in found_items]
@@ -222,66 +499,61 @@ class ATSScorer:
     
     def _extract_work_experience(self, text: str) -> List[Dict[str, Any]]:
         """Extract work experience details from resume text."""
-        # Enhanced date pattern with support for various formats
-        date_pattern = r'(?i)(?:(?P<start_month>Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s*(?P<start_year>\d{4})\s*[–-]\s*(?P<end_month>Present|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s*\d{4})?)'
-        
-        # Expanded job title patterns with more roles and levels
-        job_levels = r'(?:(?:Senior|Junior|Lead|Staff|Principal|Associate|Director|VP|CTO|CEO|Founder)\s+)?'
-        job_roles = r'(?:Software\s+Engineer|Developer|Data\s+Scientist|ML\s+Engineer|AI\s+Engineer|'
-        job_roles += r'Product\s+Manager|Project\s+Manager|Engineering\s+Manager|DevOps\s+Engineer|'
-        job_roles += r'QA\s+Engineer|Test\s+Engineer|UI/UX\s+Designer|Full\s+Stack|Back\s+End|Front\s+End|'
-        job_roles += r'Cloud\s+Architect|Solutions\s+Architect|Data\s+Engineer|Database\s+Admin|'
-        job_roles += r'Security\s+Engineer|Network\s+Engineer|Systems\s+Administrator)'
-        
-        job_title_pattern = fr'\b{job_levels}{job_roles}\b'
-        
-        # Company name pattern (simplified)
-        company_pattern = r'(?i)(?:(?:at|@|\bat\b)\s*)([A-Z][A-Za-z0-9&.\-\s]+?)(?=\s*(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|\d|\n|$))'
-        
         # Extract work experience sections
         work_experience = []
         current_exp = {}
         
         # Split text into lines and process
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        lines = [line for raw in text.split('\n') if (line := raw.strip())]
+        
+        # Bound once: every line goes through the date search
+        date_search = _DATE_RE.search
         
         for line in lines:
             # Check for date range at start of line
-            date_match = re.search(date_pattern, line)
+            date_match = date_search(line)
             if date_match:
                 if current_exp:  # Save previous experience
                     work_experience.append(current_exp)
+                start_month, start_year, end_month = date_match.group('start_month', 'start_year', 'end_month')
                 current_exp = {
                     'dates': date_match.group(0),
-                    'start_date': f"{date_match.group('start_month')} {date_match.group('start_year')}" if date_match.group('start_month') else None,
-                    'end_date': 'Present' if date_match.group('end_month') == 'Present' else 
-                               f"{date_match.group('end_month')} {date_match.group('end_year')}" if date_match.group('end_month') and date_match.group('end_month') != 'Present' else None,
+                    'start_date': f"{start_month} {start_year}" if start_month else None,
+                    # end_month already carries its year (e.g. "Dec 2019") or is "Present"
+                    'end_date': 'Present' if end_month and end_month.lower() == 'present' else end_month,
                     'title': None,
                     'company': None,
                     'bullet_points': []
                 }
             
+            # Nothing below applies until the first dated position has been seen
+            if not current_exp:
+                continue
+            
             # Check for job title
-            title_match = re.search(job_title_pattern, line, re.IGNORECASE)
-            if title_match and current_exp and not current_exp.get('title'):
-                current_exp['title'] = title_match.group(0)
+            if not current_exp['title']:
+                title_match = _JOB_TITLE_RE.search(line)
+                if title_match:
+                    current_exp['title'] = title_match.group(0)
             
             # Check for company name
-            company_match = re.search(company_pattern, line)
-            if company_match and current_exp and not current_exp.get('company'):
-                current_exp['company'] = company_match.group(1).strip()
+            if not current_exp['company']:
+                company_match = _COMPANY_RE.search(line)
+                if company_match:
+                    current_exp['company'] = company_match.group(1).strip()
             
             # Check for bullet points
-            bullet_match = re.match(r'^[•\-*]\s+(.+)', line)
-            if bullet_match and current_exp:
-                point = bullet_match.group(1).strip()
-                # Check for metrics and achievements
-                metrics = re.findall(r'\b(?:increased|reduced|saved|improved|grew|optimized|decreased|boosted|achieved|delivered)\b.*?\b(?:by|to|from)?\s*\$?\d+(?:\.\d+)?[%kKmMbB]?\b', point, re.IGNORECASE)
-                current_exp['bullet_points'].append({
-                    'text': point,
-                    'has_metrics': bool(metrics),
-                    'action_verb': re.match(r'^\w+', point).group(0).lower() if re.match(r'^\w+', point) else None
-                })
+            if line[0] in '•-*':
+                bullet_match = _BULLET_RE.match(line)
+                if bullet_match:
+                    point = bullet_match.group(1).strip()
+                    verb_match = _LEADING_WORD_RE.match(point)
+                    current_exp['bullet_points'].append({
+                        'text': point,
+                        # Only whether the bullet has a metric matters, so stop at the first
+                        'has_metrics': _METRICS_RE.search(point) is not None,
+                        'action_verb': verb_match.group(0).lower() if verb_match else None
+                    })
         
         if current_exp:  # Add the last experience
             work_experience.append(current_exp)
@@ -335,7 +607,6 @@ class ATSScorer:
         # 2. Career Progression (20 points)
         if len(work_experience) > 1:
             # Check for increasing responsibility (simplified)
-            seniority_keywords = ['junior', 'associate', '', 'senior', 'lead', 'principal', 'manager', 'director', 'vp', 'cto', 'ceo']
             previous_level = -1
             progression_score = 0
             
@@ -343,12 +614,10 @@ class ATSScorer:
                 if not exp.get('title'):
                     continue
                     
-                current_level = 0
-                title_lower = exp['title'].lower()
-                for i, keyword in enumerate(seniority_keywords):
-                    if keyword and keyword in title_lower:
-                        current_level = i
-                        break
+                current_level = min(
+                    (_SENIORITY_LEVELS[m.group(1)] for m in _SENIORITY_RE.finditer(exp['title'].lower())),
+                    default=0
+                )
                 
                 if current_level > previous_level:
                     progression_score += 5  # Points for showing growth
@@ -379,12 +648,11 @@ class ATSScorer:
         
         # 4. Technical Depth (20 points)
         # Check for technical skills in work experience
-        technical_terms = 0
-        for exp in work_experience:
-            for bullet in exp.get('bullet_points', []):
-                # Count technical terms (simplified)
-                technical_terms += len(re.findall(r'\b(?:API|REST|GraphQL|AWS|Azure|GCP|Docker|Kubernetes|React|Angular|Vue|Python|Java|JavaScript|TypeScript|SQL|NoSQL|MongoDB|PostgreSQL|MySQL|Machine Learning|AI|ML|Data Science|CI/CD|Terraform|Ansible|Git|Agile|Scrum|DevOps|Microservices)\b', 
-                                                bullet['text'], re.IGNORECASE))
+        # Count technical terms (simplified) in one scan over all bullet text
+        bullet_text = '\n'.join(
+            bullet['text'] for exp in work_experience for bullet in exp.get('bullet_points', [])
+        )
+        technical_terms = self._tech_scanner.count(bullet_text.lower())
         
         score_breakdown['technical_depth'] = min(20, technical_terms * 2)  # 2 points per technical term, capped at 20
         
@@ -445,13 +713,9 @@ class ATSScorer:
     def _score_education(self, text: str) -> Tuple[float, float, Dict[str, Any]]:
         """Score based on education section."""
         # Look for degree types, institutions, and graduation years
-        degree_pattern = '|'.join(map(re.escape, self.degree_types))
-        institution_pattern = r'\b(?:University|College|Institute|School|Univ\.?|Inst\.?|Tech|Polytechnic)\b'
-        year_pattern = r'\b(?:19|20)\d{2}\b'
-        
-        degrees = re.findall(degree_pattern, text, re.IGNORECASE)
-        institutions = re.findall(institution_pattern, text, re.IGNORECASE)
-        years = re.findall(year_pattern, text)
+        degrees = self._degree_re.findall(text)
+        institutions = _INSTITUTION_RE.findall(text)
+        years = _YEAR_RE.findall(text)
         
         # Calculate score
         score = 0
@@ -489,19 +753,15 @@ class ATSScorer:
             'feedback': " ".join(feedback) if feedback else "Education section is complete with degree, institution, and dates."
         }
     
-    def _score_skills(self, text: str) -> Tuple[float, float, Dict[str, Any]]:
+    def _score_skills(self, text: str, present: Set[str]) -> Tuple[float, float, Dict[str, Any]]:
         """Score based on skills section."""
         # Look for skills section (common section headers)
-        skills_section = re.search(
-            r'(?i)(?:skills|technical\s+skills|technical\s+expertise|technologies)[:;\s]*(.+?)(?=\n\w|$)', 
-            text, 
-            re.DOTALL
-        )
+        skills_section = _SKILLS_SECTION_RE.search(text)
         
         if skills_section:
             skills_text = skills_section.group(1)
             # Count number of skills (comma/pipe separated or bullet points)
-            skills = [s.strip() for s in re.split(r'[,\n\|•]', skills_text) if s.strip()]
+            skills = [skill for raw in skills_text.translate(_SKILL_SEP_TRANS).split('\n') if (skill := raw.strip())]
             skill_count = len(skills)
             
             # Score based on number of skills (5-15 is ideal)
@@ -535,11 +795,10 @@ class ATSScorer:
             }
         
         # If no dedicated skills section, look for skills throughout the document
-        all_skills = []
-        for category, keywords in self.common_keywords.items():
-            for keyword in keywords:
-                if re.search(rf'\b{re.escape(keyword)}\b', text, re.IGNORECASE):
-                    all_skills.append(keyword)
+        all_skills = [
+            keyword for keywords in self.common_keywords.values()
+            for keyword in keywords if keyword in present
+        ]
         
         if all_skills:
             return 50, 100, {
@@ -556,28 +815,19 @@ class ATSScorer:
             'feedback': "No skills section found. Add a 'Skills' section listing your technical and soft skills."
         }
     
-    def _score_achievements(self, text: str) -> Tuple[float, float, Dict[str, Any]]:
+    def _score_achievements(self, text: str, text_lower: str) -> Tuple[float, float, Dict[str, Any]]:
         """Score based on achievements and impact statements."""
         # Look for quantifiable achievements
-        quantifiers = [
-            r'\b(?:increased|reduced|saved|grew|improved|decreased|optimized|boosted|expanded|delivered)\b[^.!?]*\b(?:by\s+)?(\d+%?|\$\d+[KkMm]?|\d+[KkMm]?\$?)\b',
-            r'\b(?:award|certification|recognition|honor|prize|scholarship|publication|presentation|patent)\b',
-            r'\b(?:led|managed|mentored|trained|supervised)\b[^.!?]*\b(?:team|group|project)\b',
-            r'\b(?:presented|published|speaker|talk|workshop|conference)\b'
-        ]
-        
-        achievements = []
-        for pattern in quantifiers:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            achievements.extend(matches)
+        achievements = chain.from_iterable(
+            pattern.findall(text) for triggers, pattern in _ACHIEVEMENT_RES
+            if any(word in text_lower for word in triggers)
+        )
         
-        # Remove duplicates while preserving order
-        unique_achievements = []
-        seen = set()
+        # Remove case-insensitive duplicates, keeping the first spelling in order
+        seen = {}
         for ach in achievements:
-            if ach.lower() not in seen:
-                seen.add(ach.lower())
-                unique_achievements.append(ach)
+            seen.setdefault(ach.lower(), ach)
+        unique_achievements = list(seen.values())
         
         # Calculate score based on number of unique achievements
         achievement_count = len(unique_achievements)
@@ -601,17 +851,15 @@ class ATSScorer:
             'feedback': feedback
         }
     
-    def _score_formatting(self, text: str) -> Tuple[float, float, Dict[str, Any]]:
+    def _score_formatting(self, text: str, text_lower: str) -> Tuple[float, float, Dict[str, Any]]:
         """Score based on resume formatting and structure."""
         score = 50  # Start with a baseline score
         feedback = []
         missing_sections: List[str] = []
         
         # Check for section headers
-        section_headers_found = []
-        for header in self.section_headers:
-            if re.search(rf'\b{re.escape(header)}\b', text, re.IGNORECASE):
-                section_headers_found.append(header)
+        present = self._section_scanner.find(text_lower)
+        section_headers_found = [header for header in self.section_headers if header in present]
         
         if not section_headers_found:
             feedback.append("No clear section headers found. Use clear section headings like 'Experience', 'Education', etc.")
@@ -622,8 +870,12 @@ class ATSScorer:
             if missing_sections:
                 feedback.append(f"Consider adding sections for: {', '.join(missing_sections)}.")
         
+        # Line counts, bullet styles and all-caps lines come from one pass
+        scan = _scan_text(text)
+        line_count = scan['line_count']
+        bullet_styles = scan['bullet_styles']
+        
         # Check length (1-2 pages is ideal)
-        line_count = len([line for line in text.split('\n') if line.strip()])
         if line_count < 20:
             score -= 10
             feedback.append("Resume seems too short. Consider adding more details about your experience and skills.")
@@ -632,21 +884,19 @@ class ATSScorer:
             feedback.append("Resume might be too long. Consider condensing to 1-2 pages.")
         
         # Check for consistent formatting
-        bullet_styles = set(re.findall(r'^\s*([•\-*])\s+', text, re.MULTILINE))
         if len(bullet_styles) > 1:
             score -= 5
             feedback.append("Inconsistent bullet point styles. Use the same bullet style throughout.")
         
         # Check for proper spacing
-        double_newlines = text.count('\n\n')
-        single_newlines = text.count('\n') - (2 * double_newlines)
+        double_newlines = scan['double_newlines']
+        single_newlines = scan['newlines'] - (2 * double_newlines)
         if single_newlines > (double_newlines * 2):
             score -= 5
             feedback.append("Inconsistent spacing. Ensure consistent spacing between sections and paragraphs.")
         
         # Check for proper capitalization in section headers
-        all_caps_headers = re.findall(r'^[A-Z\s]+$', text, re.MULTILINE)
-        if all_caps_headers and len(all_caps_headers) > 3:  # More than 3 all-caps lines
+        if scan['all_caps_lines'] > 3:  # More than 3 all-caps lines
             score -= 5
             feedback.append("Avoid using ALL CAPS for section headers. Use title case instead.")
         
@@ -660,117 +910,20 @@ class ATSScorer:
             'feedback': " ".join(feedback) if feedback else "Good structure and formatting detected."
         }
 
-def _score_skills(self, text: str) -> Tuple[float, float, Dict[str, Any]]:
-    """Score based on skills section."""
-    # Look for skills section (common section headers)
-    skills_section = re.search(
-        r'(?i)(?:skills|technical\s+skills|technical\s+expertise|technologies)[:;\s]*(.+?)(?=\n\w|$)', 
-        text, 
-        re.DOTALL
-    )
-    
-    if skills_section:
-        skills_text = skills_section.group(1)
-        # Count number of skills (comma/pipe separated or bullet points)
-        skills = [s.strip() for s in re.split(r'[,\n\|•]', skills_text) if s.strip()]
-        skill_count = len(skills)
-        
-        # Score based on number of skills (5-15 is ideal)
-        if skill_count == 0:
-            score = 0
-            feedback = "No skills listed in the skills section."
-        elif skill_count < 5:
-            score = 30 + (skill_count * 5)
-            feedback = f"Only {skill_count} skills listed. Aim for 10-15 relevant skills."
-        elif skill_count > 20:
-            score = 80
-            feedback = "Consider focusing on the most relevant 10-15 skills."
-        else:
-            score = 40 + min(skill_count * 4, 60)  # Cap at 100
-            feedback = "Good number of skills listed."
-        
-        # Check for skills organization
-        categories = set()
-        for line in skills_text.split('\n'):
-            if ':' in line:  # Likely a category header
-                categories.add(line.split(':')[0].strip().lower())
-        
-        if not categories and skill_count > 5:
-            feedback += " Consider grouping skills by category (e.g., 'Languages: Python, Java')."
-        
-        return score, 100, {
-            'skills_found': skills,
-            'skill_count': skill_count,
-            'categories_found': list(categories),
-            'feedback': feedback
-        }
-    
-    # If no dedicated skills section, look for skills throughout the document
-    all_skills = []
-    for category, keywords in self.common_keywords.items():
-        for keyword in keywords:
-            if re.search(rf'\b{re.escape(keyword)}\b', text, re.IGNORECASE):
-                all_skills.append(keyword)
-    
-    if all_skills:
-        return 50, 100, {
-            'skills_found': all_skills,
-            'skill_count': len(all_skills),
-            'categories_found': [],
-            'feedback': "Skills are mentioned but not in a dedicated section. Add a 'Skills' section for better visibility."
-        }
-    
-    return 20, 100, {
-        'skills_found': [],
-        'skill_count': 0,
-        'categories_found': [],
-        'feedback': "No skills section found. Add a 'Skills' section listing your technical and soft skills."
-    }
+# Shared scorer: its keyword tables, scanners and result cache are built once
+_scorer: Optional[ATSScorer] = None
+_scorer_lock = threading.Lock()
 
-def _score_achievements(self, text: str) -> Tuple[float, float, Dict[str, Any]]:
-    """Score based on achievements and impact statements."""
-    # Look for quantifiable achievements
-    quantifiers = [
-        r'\b(?:increased|reduced|saved|grew|improved|decreased|optimized|boosted|expanded|delivered)\b[^.!?]*\b(?:by\s+)?(\d+%?|\$\d+[KkMm]?|\d+[KkMm]?\$?)\b',
-        r'\b(?:award|certification|recognition|honor|prize|scholarship|publication|presentation|patent)\b',
-        r'\b(?:led|managed|mentored|trained|supervised)\b[^.!?]*\b(?:team|group|project)\b',
-        r'\b(?:presented|published|speaker|talk|workshop|conference)\b'
-    ]
-    
-    achievements = []
-    for pattern in quantifiers:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        achievements.extend(matches)
-    
-    # Remove duplicates while preserving order
-    unique_achievements = []
-    seen = set()
-    for ach in achievements:
-        if ach.lower() not in seen:
-            seen.add(ach.lower())
-            unique_achievements.append(ach)
-    
-    # Calculate score based on number of unique achievements
-    achievement_count = len(unique_achievements)
-    
-    if achievement_count == 0:
-        score = 20
-        feedback = "No clear achievements or impact statements found. Add quantifiable results (e.g., 'Increased performance by 30%')."
-    elif achievement_count == 1:
-        score = 50
-        feedback = "Found 1 achievement. Add more quantifiable results to strengthen your resume."
-    elif achievement_count == 2:
-        score = 70
-        feedback = "Good start with achievements. Include 1-2 more for greater impact."
-    else:
-        score = min(90 + (achievement_count * 2), 100)
-        feedback = f"Found {achievement_count} achievements. Great job highlighting your impact!"
-    
-    return score, 100, {
-        'achievement_count': achievement_count,
-        'achievement_examples': unique_achievements[:5],
-        'feedback': feedback
-    }
+def _get_scorer() -> ATSScorer:
+    """Get or create the module-wide ATSScorer."""
+    global _scorer
+    scorer = _scorer
+    if scorer is None:
+        with _scorer_lock:
+            if _scorer is None:
+                _scorer = ATSScorer()
+            scorer = _scorer
+    return scorer
 
 def calculate_ats_score(text: str, return_full_result: bool = False) -> Union[float, ScoreResult]:
     """
@@ -788,22 +941,24 @@ def calculate_ats_score(text: str, return_full_result: bool = False) -> Union[fl
             logger.warning("Empty or invalid text provided for ATS scoring")
             return ScoreResult(0, 100, {}, ["Empty or invalid resume text provided"]) if return_full_result else 0.0
             
-        scorer = ATSScorer()
-        result = scorer.calculate_score(text)
+        result = _get_scorer().calculate_score(text)
         
         # Ensure the score is within valid range
-        result.score = max(0, min(100, result.score))
+        result = replace(result, score=max(0, min(100, result.score)))
         
         # Log the score for debugging
-        logger.info(f"Calculated ATS score: {result.score:.1f}")
+        logger.info("Calculated ATS score: %.1f", result.score)
         
         return result if return_full_result else result.score
         
     except Exception as e:
         error_msg = f"Error calculating ATS score: {str(e)}"
         logger.error(error_msg)
-        logger.error(f"Text length: {len(text) if text else 0} characters")
-        logger.error(f"Text sample: {text[:200]}..." if text else "No text provided")
+        logger.error("Text length: %s characters", len(text) if text else 0)
+        if text:
+            logger.error("Text sample: %s...", text[:200])
+        else:
+            logger.error("No text provided")
         
         if return_full_result:
             return ScoreResult(0, 100, {}, [error_msg])
@@ -3,19 +3,83 @@ import json
 import time
 from dataclasses import dataclass, asdict, field
 from typing import List, Dict, Optional, Tuple, Any
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+import atexit
 import logging
+import threading
+from functools import partial
 from pathlib import Path
 
 # Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+try:
+    from config.settings import BLOCKCHAIN_SETTINGS
+except ImportError:
+    BLOCKCHAIN_SETTINGS = {"difficulty": 2, "mining_workers": 1}
+
+# Canonical block encoding: sorted keys, compact separators, UTF-8 bytes.
+# orjson and the stdlib fallback produce the same bytes for block contents.
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode()
+
+# OpenSSL-backed SHA-256 (uses SHA-NI where the CPU has it). These hashes
+# fingerprint content rather than protect secrets, so they stay usable on
+# FIPS-restricted builds.
+_sha256 = partial(hashlib.new, 'sha256', usedforsecurity=False)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+def _iso(ns: int) -> str:
+    """Format a time.time_ns() timestamp as a UTC ISO-8601 string."""
+    return (_EPOCH + timedelta(microseconds=ns // 1000)).isoformat(sep=' ')
+
+# Nonces tried per call into _search_nonce (per worker) before mine_block checks back in
+_MINING_CHUNK = 1 << 16
+
+def _search_nonce(prefix: bytes, suffix: bytes, difficulty: int,
+                  start: int, stop: int, step: int = 1) -> Optional[Tuple[int, str]]:
+    """
+    Search range(start, stop, step) for a nonce whose block hash meets difficulty.
+    
+    Args:
+        prefix: Serialized block bytes before the nonce
+        suffix: Serialized block bytes after the nonce
+        difficulty: Required number of leading zero hex digits
+        start: First nonce to try
+        stop: Nonce to stop before
+        step: Stride between tried nonces
+        
+    Returns:
+        (nonce, hex digest) of the first match, or None if the range has none
+    """
+    # Everything before the nonce is hashed once; each attempt copies that
+    # SHA-256 state and feeds only the nonce and the short tail
+    copy = _sha256(prefix).copy
+    # Check the raw digest: whole zero bytes, then the high nibble of the next
+    # byte for odd difficulties; only a hit is hex-encoded
+    full, odd = divmod(difficulty, 2)
+    zeros = bytes(full)
+    for nonce in range(start, stop, step):
+        h = copy()
+        h.update(b'%d' % nonce + suffix)
+        digest = h.digest()
+        if digest[:full] == zeros and (not odd or digest[full] < 0x10):
+            return nonce, digest.hex()
+    return None
+
+@dataclass(slots=True)
 class Block:
     """Represents a block in the blockchain."""
     index: int
-    timestamp: str
+    timestamp: int  # time.time_ns(); format with _iso() for display
     data: Dict[str, Any]
     previous_hash: str
     nonce: int = 0
@@ -27,37 +91,95 @@ class Block:
     
     def calculate_hash(self) -> str:
         """Calculate the SHA-256 hash of the block."""
-        block_string = json.dumps({
-            'index': self.index,
-            'timestamp': self.timestamp,
-            'data': self.data,
-            'previous_hash': self.previous_hash,
-            'nonce': self.nonce
-        }, sort_keys=True).encode()
-        return hashlib.sha256(block_string).hexdigest()
+        prefix, suffix = self._serialize_around_nonce()
+        return _sha256(b'%s%d%s' % (prefix, self.nonce, suffix)).hexdigest()
     
-    def mine_block(self, difficulty: int) -> None:
-        """Mine the block with the given difficulty."""
+    def _serialize_around_nonce(self) -> Tuple[bytes, bytes]:
+        """
+        Split the serialized block around its nonce.
+        
+        ``prefix + str(nonce).encode() + suffix`` is the canonical encoding
+        of the block: _dumps() of its fields with keys in sorted order. The
+        schema is fixed, so only ``data`` goes through the general encoder.
+        
+        Returns:
+            The bytes before the nonce value and the bytes after it
+        """
+        prefix = b'{"data":%s,"index":%d,"nonce":' % (_dumps(self.data), self.index)
+        suffix = b',"previous_hash":%s,"timestamp":%d}' % (_dumps(self.previous_hash), self.timestamp)
+        return prefix, suffix
+    
+    def mine_block(self, difficulty: int, pool: Optional[ProcessPoolExecutor] = None, workers: int = 1) -> None:
+        """
+        Mine the block with the given difficulty.
+        
+        Args:
+            difficulty: Number of leading zero hex digits the hash needs
+            pool: Optional process pool to spread the nonce search over
+            workers: Number of processes in pool
+        """
         target = '0' * difficulty
-        while self.hash[:difficulty] != target:
-            self.nonce += 1
-            self.hash = self.calculate_hash()
+        if self.hash[:difficulty] == target:
+            return
+        
+        prefix, suffix = self._serialize_around_nonce()
+        start = self.nonce + 1
+        if pool is None:
+            workers = 1
+        span = _MINING_CHUNK * workers
+        while True:
+            if pool is None:
+                found = _search_nonce(prefix, suffix, difficulty, start, start + span)
+            else:
+                # Workers take interleaved nonces; keeping the smallest hit finds
+                # the same nonce a sequential search would
+                futures = [
+                    pool.submit(_search_nonce, prefix, suffix, difficulty, start + i, start + span, workers)
+                    for i in range(workers)
+                ]
+                hits = [hit for hit in (future.result() for future in futures) if hit is not None]
+                found = min(hits) if hits else None
+            if found is not None:
+                break
+            start += span
+        self.nonce, self.hash = found
 
 class Blockchain:
     """A simple blockchain implementation for resume verification."""
     
-    def __init__(self, difficulty: int = 4):
+    __slots__ = (
+        'chain', 'pending_transactions', 'difficulty', 'workers', '_pool', '_difficulty_target',
+        '_validated_len', '_pending_index', '_verification_index', '_verified_by_hash', '_lock',
+    )
+    
+    def __init__(self, difficulty: int = 4, workers: int = 1):
         """Initialize the blockchain with a genesis block."""
         self.chain: List[Block] = []
         self.pending_transactions: List[Dict] = []
+        # Guards the chain, pending list and indexes; reentrant because
+        # verify_resume adds and mines under it
+        self._lock = threading.RLock()
         self.difficulty = difficulty
+        # Leading hex digits every mined hash must start with
+        self._difficulty_target = '0' * difficulty
+        # Worker processes only pay for their startup at high difficulty
+        self.workers = workers
+        self._pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        # Length of the chain prefix that last passed is_chain_valid
+        self._validated_len = 1
+        # verification_id -> position in pending_transactions / (block index, transaction index)
+        self._pending_index: Dict[str, int] = {}
+        self._verification_index: Dict[str, Tuple[int, int]] = {}
+        # resume_hash -> record of its successful verification, so resubmitting
+        # the same resume doesn't mine another block
+        self._verified_by_hash: Dict[str, Dict[str, Any]] = {}
         self.create_genesis_block()
     
     def create_genesis_block(self) -> None:
         """Create the genesis block (first block in the chain)."""
         genesis_block = Block(
             index=0,
-            timestamp=str(datetime.utcnow()),
+            timestamp=time.time_ns(),
             data={
                 'type': 'genesis',
                 'message': 'Genesis block for Resume Verification Blockchain'
@@ -72,69 +194,111 @@ class Blockchain:
         """Get the most recent block in the chain."""
         return self.chain[-1]
     
+    def close(self) -> None:
+        """Shut down the mining worker pool; later blocks are mined in-process."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown()
+    
+    def __enter__(self) -> 'Blockchain':
+        """Use the blockchain as a context manager that closes its pool on exit."""
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        """Close the blockchain on leaving the ``with`` block."""
+        self.close()
+    
     def add_transaction(self, data: Dict[str, Any]) -> int:
         """Add a new transaction to the list of pending transactions."""
-        self.pending_transactions.append({
-            **data,
-            'timestamp': str(datetime.utcnow())
-        })
-        return self.last_block.index + 1  # Index of the block that will contain this transaction
+        with self._lock:
+            self.pending_transactions.append({
+                **data,
+                'timestamp': time.time_ns()
+            })
+            verification_id = data.get('verification_id')
+            if verification_id is not None:
+                self._pending_index.setdefault(verification_id, len(self.pending_transactions) - 1)
+            return self.last_block.index + 1  # Index of the block that will contain this transaction
     
     def mine_pending_transactions(self, miner_address: str) -> Block:
         """Mine all pending transactions."""
-        if not self.pending_transactions:
-            raise ValueError("No transactions to mine")
-        
-        # Create a new block with all pending transactions
-        new_block = Block(
-            index=len(self.chain),
-            timestamp=str(datetime.utcnow()),
-            data={
-                'transactions': self.pending_transactions.copy(),
-                'miner': miner_address,
-                'block_reward': 1.0  # Simulate block reward
-            },
-            previous_hash=self.last_block.hash
-        )
-        
-        # Mine the block (proof of work)
-        logger.info(f"Mining block {new_block.index}...")
-        start_time = time.time()
-        new_block.mine_block(self.difficulty)
-        mining_time = time.time() - start_time
-        
-        logger.info(f"Block {new_block.index} mined in {mining_time:.2f} seconds. Hash: {new_block.hash}")
-        
-        # Add the block to the chain
-        self.chain.append(new_block)
-        
-        # Clear pending transactions
-        self.pending_transactions = []
-        
-        return new_block
-    
-    def is_chain_valid(self) -> bool:
-        """Check if the blockchain is valid."""
-        for i in range(1, len(self.chain)):
-            current_block = self.chain[i]
-            previous_block = self.chain[i - 1]
+        with self._lock:
+            if not self.pending_transactions:
+                raise ValueError("No transactions to mine")
+            
+            # Create a new block with all pending transactions. The block takes the
+            # list itself; pending_transactions is rebound to a fresh list once the
+            # block is on the chain, so a failed mine leaves it untouched
+            new_block = Block(
+                index=len(self.chain),
+                timestamp=time.time_ns(),
+                data={
+                    'transactions': self.pending_transactions,
+                    'miner': miner_address,
+                    'block_reward': 1.0  # Simulate block reward
+                },
+                previous_hash=self.last_block.hash
+            )
+            
+            # Mine the block (proof of work)
+            logger.info("Mining block %s...", new_block.index)
+            start_time = time.time()
+            new_block.mine_block(self.difficulty, self._pool, self.workers)
+            mining_time = time.time() - start_time
+            
+            logger.info("Block %s mined in %.2f seconds. Hash: %s", new_block.index, mining_time, new_block.hash)
             
-            # Check if the current block's hash is correct
-            if current_block.hash != current_block.calculate_hash():
-                logger.error(f"Block {current_block.index} has an invalid hash")
-                return False
+            # Add the block to the chain
+            self.chain.append(new_block)
             
-            # Check if the previous hash matches
-            if current_block.previous_hash != previous_block.hash:
-                logger.error(f"Block {current_block.index} has an invalid previous hash")
-                return False
+            # Index the mined transactions, keeping the earliest block for a repeated ID
+            for i, tx in enumerate(new_block.data['transactions']):
+                verification_id = tx.get('verification_id')
+                if verification_id is not None:
+                    self._verification_index.setdefault(verification_id, (new_block.index, i))
             
-            # Check if the proof of work is valid
-            if current_block.hash[:self.difficulty] != '0' * self.difficulty:
-                logger.error(f"Block {current_block.index} has an invalid proof of work")
-                return False
+            # Start a new pending list (the old one now belongs to the block)
+            self.pending_transactions = []
+            self._pending_index = {}
+            
+            return new_block
+    
+    def is_chain_valid(self, incremental: bool = False) -> bool:
+        """
+        Check if the blockchain is valid.
         
-        return True
+        Args:
+            incremental: Skip blocks that passed an earlier check and only re-hash
+                blocks appended since. This cannot detect in-place edits to
+                already-validated blocks, so tamper checks should use the default.
+            
+        Returns:
+            True if every checked block is intact and linked
+        """
+        with self._lock:
+            start = self._validated_len if incremental else 1
+            for i in range(start, len(self.chain)):
+                current_block = self.chain[i]
+                previous_block = self.chain[i - 1]
+                
+                # Check if the current block's hash is correct
+                if current_block.hash != current_block.calculate_hash():
+                    logger.error("Block %s has an invalid hash", current_block.index)
+                    return False
+                
+                # Check if the previous hash matches
+                if current_block.previous_hash != previous_block.hash:
+                    logger.error("Block %s has an invalid previous hash", current_block.index)
+                    return False
+                
+                # Check if the proof of work is valid
+                if not current_block.hash.startswith(self._difficulty_target):
+                    logger.error("Block %s has an invalid proof of work", current_block.index)
+                    return False
+            
+            self._validated_len = len(self.chain)
+            return True
     
     def verify_resume(self, resume_text: str) -> Dict[str, Any]:
         """
@@ -150,36 +314,43 @@ class Blockchain:
             raise ValueError("Resume text must be a non-empty string")
         
         # Create a hash of the resume content
-        resume_hash = hashlib.sha256(resume_text.encode()).hexdigest()
+        resume_hash = _sha256(resume_text.encode()).hexdigest()
         
-        # Create a verification record
-        verification_id = f"VER-{int(time.time())}-{resume_hash[:8]}"
-        
-        # Add the verification as a transaction
-        verification_data = {
-            'type': 'resume_verification',
-            'verification_id': verification_id,
-            'resume_hash': resume_hash,
-            'timestamp': str(datetime.utcnow()),
-            'status': 'pending'
-        }
-        
-        # Add to pending transactions
-        block_index = self.add_transaction(verification_data)
-        
-        # Mine the block (in a real implementation, this would be done by miners)
-        try:
-            block = self.mine_pending_transactions("cavro_verification_node")
-            verification_data['status'] = 'verified'
-            verification_data['block_index'] = block.index
-            verification_data['block_hash'] = block.hash
-            verification_data['transaction_index'] = len(block.data['transactions']) - 1
-        except Exception as e:
-            logger.error(f"Failed to mine block: {e}")
-            verification_data['status'] = 'failed'
-            verification_data['error'] = str(e)
-        
-        return verification_data
+        with self._lock:
+            verified = self._verified_by_hash.get(resume_hash)
+            if verified is not None:
+                return dict(verified)
+            
+            # Create a verification record
+            now_ns = time.time_ns()
+            verification_id = f"VER-{now_ns // 1_000_000_000}-{resume_hash[:8]}"
+            
+            # Add the verification as a transaction
+            verification_data = {
+                'type': 'resume_verification',
+                'verification_id': verification_id,
+                'resume_hash': resume_hash,
+                'timestamp': _iso(now_ns),
+                'status': 'pending'
+            }
+            
+            # Add to pending transactions
+            block_index = self.add_transaction(verification_data)
+            
+            # Mine the block (in a real implementation, this would be done by miners)
+            try:
+                block = self.mine_pending_transactions("cavro_verification_node")
+                verification_data['status'] = 'verified'
+                verification_data['block_index'] = block.index
+                verification_data['block_hash'] = block.hash
+                verification_data['transaction_index'] = len(block.data['transactions']) - 1
+                self._verified_by_hash[resume_hash] = dict(verification_data)
+            except Exception as e:
+                logger.error("Failed to mine block: %s", e)
+                verification_data['status'] = 'failed'
+                verification_data['error'] = str(e)
+            
+            return verification_data
     
     def get_verification_status(self, verification_id: str) -> Dict[str, Any]:
         """
@@ -191,45 +362,57 @@ class Blockchain:
         Returns:
             A dictionary containing the verification status and details
         """
-        # Check pending transactions first
-        for tx in self.pending_transactions:
-            if tx.get('verification_id') == verification_id:
+        with self._lock:
+            # Check pending transactions first
+            pending_pos = self._pending_index.get(verification_id)
+            if pending_pos is not None:
+                tx = self.pending_transactions[pending_pos]
                 return {
                     'verification_id': verification_id,
                     'status': 'pending',
-                    'timestamp': tx.get('timestamp')
+                    'timestamp': _iso(tx['timestamp'])
                 }
-        
-        # Check the blockchain
-        for block in self.chain[1:]:  # Skip genesis block
-            if 'transactions' in block.data:
-                for i, tx in enumerate(block.data['transactions']):
-                    if tx.get('verification_id') == verification_id:
-                        return {
-                            'verification_id': verification_id,
-                            'status': 'verified',
-                            'block_index': block.index,
-                            'block_hash': block.hash,
-                            'transaction_index': i,
-                            'timestamp': tx.get('timestamp'),
-                            'resume_hash': tx.get('resume_hash')
-                        }
-        
-        return {
-            'verification_id': verification_id,
-            'status': 'not_found',
-            'message': 'No verification found with the given ID'
-        }
+            
+            # Check the blockchain
+            location = self._verification_index.get(verification_id)
+            if location is not None:
+                block_index, i = location
+                block = self.chain[block_index]
+                tx = block.data['transactions'][i]
+                return {
+                    'verification_id': verification_id,
+                    'status': 'verified',
+                    'block_index': block.index,
+                    'block_hash': block.hash,
+                    'transaction_index': i,
+                    'timestamp': _iso(tx['timestamp']),
+                    'resume_hash': tx.get('resume_hash')
+                }
+            
+            return {
+                'verification_id': verification_id,
+                'status': 'not_found',
+                'message': 'No verification found with the given ID'
+            }
 
 # Singleton instance of the blockchain
-_blockchain_instance = None
+_blockchain_instance: Optional[Blockchain] = None
+_blockchain_lock = threading.Lock()
 
 def get_blockchain() -> Blockchain:
     """Get or create a singleton instance of the blockchain."""
     global _blockchain_instance
-    if _blockchain_instance is None:
-        _blockchain_instance = Blockchain(difficulty=2)  # Lower difficulty for demo purposes
-    return _blockchain_instance
+    blockchain = _blockchain_instance
+    if blockchain is None:
+        with _blockchain_lock:
+            if _blockchain_instance is None:
+                _blockchain_instance = Blockchain(
+                    difficulty=BLOCKCHAIN_SETTINGS["difficulty"],
+                    workers=BLOCKCHAIN_SETTINGS.get("mining_workers", 1)
+                )
+                atexit.register(_blockchain_instance.close)
+            blockchain = _blockchain_instance
+    return blockchain
 
 def blockchain_verify(resume_text: str) -> Dict[str, Any]:
     """
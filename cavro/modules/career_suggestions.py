@@ -1,65 +1,34 @@
 import re
 import logging
-from typing import List, Dict, Tuple, Set, Optional, Any
-from dataclasses import dataclass, field
+from typing import List, Dict, Tuple, Set, FrozenSet, Optional, Any, Union
+from dataclasses import dataclass
 from collections import defaultdict
+from functools import lru_cache
+from operator import itemgetter
+import heapq
 import json
 from pathlib import Path
+from .utils import ResumeFeatures
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 # Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
-class CareerSuggestion:
-    """
-    Data class for career suggestions with detailed matching information.
-    
-    Attributes:
-        title: Job title
-        match_score: Match score (0-100)
-        required_skills: List of required skills for this career
-        matching_skills: Skills from the resume that match required skills
-        missing_skills: Required skills missing from the resume
-        description: Career description
-        salary_range: [min, max] salary range in USD
-        growth_outlook: Job market growth outlook
-        education: Recommended education paths
-        certifications: Recommended certifications
-        preferred_skills: List of preferred skills for this career
-        matching_preferred_skills: Preferred skills from the resume
-        missing_preferred_skills: Preferred skills missing from the resume
-        job_market_demand: Current job market demand (High/Medium/Low)
-        experience_levels: Dictionary of experience levels and their descriptions
-        current_experience_level: User's current experience level
-    """
-    title: str
-    match_score: float  # 0-100
-    required_skills: List[str]
-    matching_skills: List[str]
-    missing_skills: List[str]
-    description: str = ""
-    salary_range: Optional[List[int]] = None
-    growth_outlook: str = ""
-    education: List[str] = field(default_factory=list)
-    certifications: List[str] = field(default_factory=list)
-    preferred_skills: List[str] = field(default_factory=list)
-    matching_preferred_skills: List[str] = field(default_factory=list)
-    missing_preferred_skills: List[str] = field(default_factory=list)
-    job_market_demand: str = "Medium"
-    experience_levels: Dict[str, str] = field(default_factory=dict)
-    current_experience_level: str = "entry"
-
+@lru_cache(maxsize=1)
 def load_career_data() -> Dict[str, Dict]:
-    """Load career data from a JSON file or return default data."""
+    """Load career data from a JSON file or return default data (parsed once per process; don't mutate it)."""
     try:
         # Try to load from a data file if it exists
         data_file = Path(__file__).parent.parent / 'data' / 'career_paths.json'
         if data_file.exists():
-            with open(data_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _loads(data_file.read_bytes())
     except Exception as e:
-        logger.warning(f"Failed to load career data: {str(e)}. Using default data.")
+        logger.warning("Failed to load career data: %s. Using default data.", e)
     
     # Default career data if file loading fails
     return {
@@ -192,83 +161,164 @@ def load_career_data() -> Dict[str, Dict]:
         }
     }
 
-def extract_skills(resume_text: str) -> Set[str]:
-    """Extract skills from resume text using pattern matching."""
-    if not resume_text:
-        return set()
-    
-    # Common technical skills to look for
-    technical_skills = {
-        # Programming Languages
-        'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'go', 'rust', 'swift', 'kotlin',
-        'ruby', 'php', 'r', 'matlab', 'scala', 'perl', 'haskell', 'dart', 'elixir', 'clojure',
-        
-        # Web Development
-        'html', 'css', 'react', 'angular', 'vue', 'node.js', 'django', 'flask', 'spring', 'express',
-        'laravel', 'ruby on rails', 'asp.net', 'graphql', 'rest api', 'websockets',
-        
-        # Mobile Development
-        'android', 'ios', 'react native', 'flutter', 'xamarin', 'swiftui', 'kotlin multiplatform',
-        
-        # Data Science & ML
-        'machine learning', 'deep learning', 'data analysis', 'data visualization', 'pandas',
-        'numpy', 'scikit-learn', 'tensorflow', 'pytorch', 'opencv', 'nltk', 'spacy', 'hadoop',
-        'spark', 'hive', 'kafka', 'tableau', 'power bi', 'apache beam', 'apache flink',
-        
-        # Cloud & DevOps
-        'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform', 'ansible', 'jenkins',
-        'github actions', 'gitlab ci', 'circleci', 'prometheus', 'grafana', 'istio', 'helm',
-        'linux', 'bash', 'shell scripting', 'infrastructure as code', 'serverless', 'lambda',
-        
-        # Databases
-        'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'cassandra', 'dynamodb', 'firebase',
-        'oracle', 'microsoft sql server', 'neo4j', 'elasticsearch', 'snowflake', 'bigquery',
-        
-        # Other Technologies
-        'blockchain', 'ethereum', 'solidity', 'web3', 'iot', 'raspberry pi', 'arduino',
-        'computer vision', 'nlp', 'reinforcement learning', 'quantum computing', 'robotics',
-        
-        # Soft Skills
-        'leadership', 'teamwork', 'problem solving', 'communication', 'project management',
-        'agile', 'scrum', 'kanban', 'devops', 'ci/cd', 'test driven development'
+@dataclass(frozen=True, slots=True)
+class _CareerProfile:
+    """A career's skill lists pre-lowercased, with required-skill relevance and display salary precomputed."""
+    required: Tuple[str, ...]
+    preferred: Tuple[str, ...]
+    relevance: Dict[str, float]
+    total_relevance: float
+    salary_range: Dict[str, Any]
+
+def _build_profile(career_info: Dict) -> _CareerProfile:
+    """Derive the match-scoring view of one career's data."""
+    required = tuple(s.lower() for s in career_info.get('required_skills', []))
+    preferred = tuple(s.lower() for s in career_info.get('preferred_skills', []))
+    # Earlier skills in the list are more important: 5% reduction for each position
+    relevance = {skill: 1.0 - (i * 0.05) for i, skill in enumerate(required)}
+    salary_range = career_info.get('salary_range')
+    salary = {
+        "min": salary_range[0] if salary_range else None,
+        "max": salary_range[1] if salary_range else None,
+        "formatted": f"${salary_range[0]:,}-${salary_range[1]:,}" 
+                    if salary_range and len(salary_range) == 2 
+                    else "Not specified"
     }
+    return _CareerProfile(required, preferred, relevance, sum(relevance.values()), salary)
+
+# Slack when pruning on index-estimated scores, which may sum in a different order than _match_score
+_SCORE_EPSILON = 1e-9
+
+@lru_cache(maxsize=1)
+def _career_skill_index() -> Tuple[Dict[str, Dict], Dict[str, Tuple[Tuple[str, int, float], ...]], Dict[str, _CareerProfile]]:
+    """
+    Load career data once, index careers by their required skills and build their match profiles.
     
-    # Convert resume to lowercase for case-insensitive matching
-    text_lower = resume_text.lower()
+    Each index entry carries how often the skill is required by the career and its share of
+    the weighted required-skill score, so summing a resume's entries gives every career's
+    match count and required-skill score in a single sparse pass.
     
+    Returns:
+        Tuple of (career_data, mapping of lowercase required skill -> (career id, occurrences, score share),
+        mapping of career id -> match profile)
+    """
+    career_data = load_career_data()
+    profiles = {career_id: _build_profile(career_info) for career_id, career_info in career_data.items()}
+    index = defaultdict(list)
+    for career_id, profile in profiles.items():
+        for skill, relevance in profile.relevance.items():
+            occurrences = profile.required.count(skill)
+            index[skill].append((career_id, occurrences, relevance * occurrences / profile.total_relevance * 0.6))
+    return career_data, {skill: tuple(entries) for skill, entries in index.items()}, profiles
+
+@lru_cache(maxsize=256)
+def _careers_for_interest(interest: str) -> FrozenSet[str]:
+    """Ids of careers whose title or a required skill contains the lowercase interest, memoized per interest."""
+    career_data, _, profiles = _career_skill_index()
+    return frozenset(
+        career_id for career_id, career_info in career_data.items()
+        if interest in career_info['title'].lower() or any(interest in skill for skill in profiles[career_id].required)
+    )
+
+# Common technical skills to look for
+_TECHNICAL_SKILLS = frozenset({
+    # Programming Languages
+    'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'go', 'rust', 'swift', 'kotlin',
+    'ruby', 'php', 'r', 'matlab', 'scala', 'perl', 'haskell', 'dart', 'elixir', 'clojure',
+    
+    # Web Development
+    'html', 'css', 'react', 'angular', 'vue', 'node.js', 'django', 'flask', 'spring', 'express',
+    'laravel', 'ruby on rails', 'asp.net', 'graphql', 'rest api', 'websockets',
+    
+    # Mobile Development
+    'android', 'ios', 'react native', 'flutter', 'xamarin', 'swiftui', 'kotlin multiplatform',
+    
+    # Data Science & ML
+    'machine learning', 'deep learning', 'data analysis', 'data visualization', 'pandas',
+    'numpy', 'scikit-learn', 'tensorflow', 'pytorch', 'opencv', 'nltk', 'spacy', 'hadoop',
+    'spark', 'hive', 'kafka', 'tableau', 'power bi', 'apache beam', 'apache flink',
+    
+    # Cloud & DevOps
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform', 'ansible', 'jenkins',
+    'github actions', 'gitlab ci', 'circleci', 'prometheus', 'grafana', 'istio', 'helm',
+    'linux', 'bash', 'shell scripting', 'infrastructure as code', 'serverless', 'lambda',
+    
+    # Databases
+    'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'cassandra', 'dynamodb', 'firebase',
+    'oracle', 'microsoft sql server', 'neo4j', 'elasticsearch', 'snowflake', 'bigquery',
+    
+    # Other Technologies
+    'blockchain', 'ethereum', 'solidity', 'web3', 'iot', 'raspberry pi', 'arduino',
+    'computer vision', 'nlp', 'reinforcement learning', 'quantum computing', 'robotics',
+    
+    # Soft Skills
+    'leadership', 'teamwork', 'problem solving', 'communication', 'project management',
+    'agile', 'scrum', 'kanban', 'devops', 'ci/cd', 'test driven development'
+})
+
+def _is_word_end(text: str, pos: int) -> bool:
+    """Return True if no word character follows pos (the (?!\\w) guard holds there)."""
+    return pos >= len(text) or not (text[pos].isalnum() or text[pos] == '_')
+
+# One pass finds every skill: the zero-width lookahead tries the alternation at
+# each position, so skills inside longer ones ('sql' in 'microsoft sql server')
+# are still found. Longer skills are tried first; a shorter skill that is a
+# whole-word prefix of the match ('react' of 'react native') is implied by it.
+# Skills are guarded with (?<!\w)/(?!\w) rather than \b, which can never match
+# after a trailing symbol ('c++ ', 'c# ').
+_SKILL_RE = re.compile(
+    '(?=(' + '|'.join(rf'(?<!\w){re.escape(skill)}(?!\w)' for skill in sorted(_TECHNICAL_SKILLS, key=len, reverse=True)) + '))'
+)
+_IMPLIED_SKILLS = {
+    skill: tuple(
+        other for other in _TECHNICAL_SKILLS
+        if other != skill and skill.startswith(other) and _is_word_end(skill, len(other))
+    )
+    for skill in _TECHNICAL_SKILLS
+}
+
+def extract_skills(resume_text: Union[str, ResumeFeatures]) -> FrozenSet[str]:
+    """Extract lowercase skills from resume text (or pre-tokenized features) using pattern matching."""
+    if not resume_text:
+        return frozenset()
+    return _extract_skills_cached(_raw_text(resume_text))
+
+def _raw_text(resume_text: Union[str, ResumeFeatures]) -> str:
+    """Return the original text of a resume given as raw text or ResumeFeatures."""
+    return resume_text.text if isinstance(resume_text, ResumeFeatures) else resume_text
+
+@lru_cache(maxsize=128)
+def _extract_skills_cached(text: str) -> FrozenSet[str]:
+    """extract_skills keyed on the resume text, since the UI and skill plans rescan the same resume."""
     # Find all matching skills
-    found_skills = {skill for skill in technical_skills if re.search(r'\b' + re.escape(skill) + r'\b', text_lower)}
+    found_skills = set()
+    for match in _SKILL_RE.finditer(text.lower()):
+        skill = match.group(1)
+        found_skills.add(skill)
+        found_skills.update(_IMPLIED_SKILLS[skill])
     
-    # Add any skills mentioned in the experience section
-    experience_section = re.search(r'(?i)(experience|work history)[^\n]*(\n\s*\-.*?)(?=\n\s*\n|\Z)', 
-                                 resume_text, re.DOTALL)
-    if experience_section:
-        exp_text = experience_section.group(0).lower()
-        found_skills.update(skill for skill in technical_skills if skill in exp_text)
-    
-    return found_skills
+    return frozenset(found_skills)
 
-def calculate_match_score(resume_skills: Set[str], career_data: Dict) -> Tuple[float, Dict[str, List[str]], Dict[str, float]]:
+def calculate_match_score(resume_skills: FrozenSet[str], career_data: Dict) -> Tuple[float, Dict[str, List[str]], Dict[str, float]]:
     """
     Calculate match score between resume skills and career requirements.
     
     Args:
-        resume_skills: Set of skills from the resume
+        resume_skills: Lowercase skills from the resume, as returned by extract_skills
         career_data: Dictionary containing career information including required_skills and preferred_skills
         
     Returns:
         Tuple of (match_score, skill_analysis, skill_relevance)
     """
-    required_skills = career_data.get('required_skills', [])
-    preferred_skills = career_data.get('preferred_skills', [])
-    
-    if not required_skills:
+    if not career_data.get('required_skills'):
         return 0.0, {"matching": [], "missing": [], "preferred": []}, {}
     
-    # Convert to lowercase for case-insensitive comparison
-    resume_skills_lower = {s.lower() for s in resume_skills}
-    required_skills_lower = [s.lower() for s in required_skills]
-    preferred_skills_lower = [s.lower() for s in preferred_skills]
+    return _match_score(resume_skills, _build_profile(career_data))
+
+def _match_score(resume_skills_lower: FrozenSet[str], profile: _CareerProfile) -> Tuple[float, Dict[str, List[str]], Dict[str, float]]:
+    """calculate_match_score for already-lowercased resume skills and a precomputed career profile."""
+    required_skills_lower = profile.required
+    preferred_skills_lower = profile.preferred
     
     # Find matching, missing, and preferred skills
     matching_required = [s for s in required_skills_lower if s in resume_skills_lower]
@@ -283,16 +333,10 @@ def calculate_match_score(resume_skills: Set[str], career_data: Dict) -> Tuple[f
     # Calculate preferred skills bonus (30% weight)
     preferred_bonus = (len(matching_preferred) / len(preferred_skills_lower) * 0.5) if preferred_skills_lower else 0
     
-    # Calculate skill relevance scores
-    skill_relevance = {}
-    for i, skill in enumerate(required_skills_lower):
-        # Earlier skills in the list are more important
-        relevance = 1.0 - (i * 0.05)  # 5% reduction for each position
-        skill_relevance[skill] = relevance
-    
     # Calculate weighted score based on skill relevance
+    skill_relevance = profile.relevance
     weighted_score = 0.0
-    total_relevance = sum(skill_relevance.values())
+    total_relevance = profile.total_relevance
     
     for skill in matching_required:
         weighted_score += skill_relevance.get(skill, 0.5)
@@ -321,7 +365,12 @@ def calculate_skill_relevance(skill: str, career_skills: List[str]) -> float:
     except ValueError:
         return 0.5  # Default relevance for skills not in the required list
 
-def analyze_experience_level(resume_text: str) -> str:
+_YEARS_RE = re.compile(r'(\d+)\s*(?:year|yr)s?\s+(?:of\s+)?experience')
+# Plain substring alternation, matching the original `term in text` checks
+# ('team lead' and 'tech lead' are covered by 'lead')
+_LEAD_RE = re.compile(r'senior|lead|manager|director|vp|cto|cio|architect|principal|head of')
+
+def analyze_experience_level(resume_text: Union[str, ResumeFeatures]) -> str:
     """
     Analyze the resume text to determine the experience level.
     
@@ -333,21 +382,22 @@ def analyze_experience_level(resume_text: str) -> str:
     """
     if not resume_text:
         return "entry"
-    
+    return _experience_level_cached(_raw_text(resume_text))
+
+@lru_cache(maxsize=128)
+def _experience_level_cached(text: str) -> str:
+    """analyze_experience_level keyed on the resume text."""
     # Look for experience indicators
-    text_lower = resume_text.lower()
+    text_lower = text.lower()
     
     # Check for years of experience
     years_exp = 0
-    years_match = re.search(r'(\d+)\s*(?:year|yr)s?\s+(?:of\s+)?experience', text_lower)
+    years_match = _YEARS_RE.search(text_lower)
     if years_match:
         years_exp = int(years_match.group(1))
     
     # Check for senior/lead/manager roles
-    has_leadership = any(term in text_lower for term in [
-        'senior', 'lead', 'manager', 'director', 'vp', 'cto', 'cio', 'architect',
-        'principal', 'head of', 'team lead', 'tech lead'
-    ])
+    has_leadership = _LEAD_RE.search(text_lower) is not None
     
     # Determine experience level
     if years_exp >= 10 or has_leadership and years_exp >= 5:
@@ -358,35 +408,24 @@ def analyze_experience_level(resume_text: str) -> str:
         return "mid"
     return "entry"
 
-def format_career_suggestion(suggestion: CareerSuggestion) -> Dict[str, any]:
-    """Format a career suggestion for UI display."""
+def _no_skills_suggestion(experience_level: str) -> Dict[str, Any]:
+    """Build the generic suggestion returned when no skills are found in the resume."""
     return {
-        "title": suggestion.title,
-        "match_score": round(suggestion.match_score, 1),
-        "description": suggestion.description,
-        "salary_range": {
-            "min": suggestion.salary_range[0] if suggestion.salary_range else None,
-            "max": suggestion.salary_range[1] if suggestion.salary_range else None,
-            "formatted": f"${suggestion.salary_range[0]:,}-${suggestion.salary_range[1]:,}" 
-                        if suggestion.salary_range and len(suggestion.salary_range) == 2 
-                        else "Not specified"
-        },
-        "growth_outlook": suggestion.growth_outlook,
-        "job_market_demand": getattr(suggestion, 'job_market_demand', 'Medium'),
-        "skills": {
-            "matching": [{"name": skill, "relevance": rel} for skill, rel in suggestion.matching_skills],
-            "missing": suggestion.missing_skills,
-            "matching_preferred": getattr(suggestion, 'matching_preferred_skills', []),
-            "missing_preferred": getattr(suggestion, 'missing_preferred_skills', [])
-        },
-        "education": suggestion.education,
-        "certifications": suggestion.certifications,
-        "experience_levels": getattr(suggestion, 'experience_levels', {}),
-        "current_experience_level": getattr(suggestion, 'current_experience_level', 'entry')
+        "title": "General IT Professional",
+        "match_score": 0.0,
+        "description": "Consider adding more technical skills to your resume for better career matching.",
+        "salary_range": {"min": None, "max": None, "formatted": "Not specified"},
+        "growth_outlook": "Average (5-7% growth projected)",
+        "job_market_demand": "Medium",
+        "skills": {"matching": [], "missing": [], "matching_preferred": [], "missing_preferred": []},
+        "education": [],
+        "certifications": [],
+        "experience_levels": {},
+        "current_experience_level": experience_level
     }
 
 def suggest_career_paths(
-    resume_text: str,
+    resume_text: Union[str, ResumeFeatures],
     top_n: int = 5,
     min_match_threshold: float = 0.2,
     min_required_skills: int = 2,
@@ -397,7 +436,7 @@ def suggest_career_paths(
     Suggest career paths based on skills found in the resume with enhanced matching.
     
     Args:
-        resume_text: The text content of the resume
+        resume_text: The text content of the resume, or its pre-tokenized ResumeFeatures
         top_n: Number of top career suggestions to return
         min_match_threshold: Minimum match score (0-1) to include a career suggestion
         min_required_skills: Minimum number of matching skills to consider a career
@@ -408,7 +447,7 @@ def suggest_career_paths(
     Returns:
         List of formatted career suggestions, sorted by match score (descending)
     """
-    if not resume_text or not isinstance(resume_text, str):
+    if not resume_text or not isinstance(resume_text, (str, ResumeFeatures)):
         logger.warning("Invalid resume text provided")
         return []
     
@@ -416,40 +455,45 @@ def suggest_career_paths(
     if experience_level is None:
         experience_level = analyze_experience_level(resume_text)
     
-    # Extract skills from resume (case-insensitive and deduplicated)
-    resume_skills = list({skill.lower() for skill in extract_skills(resume_text)})
-    logger.info(f"Extracted {len(resume_skills)} unique skills from resume")
+    # Extract skills from resume (already lowercase and deduplicated)
+    resume_skills = extract_skills(resume_text)
+    logger.info("Extracted %s unique skills from resume", len(resume_skills))
     
     if not resume_skills:
-        return [{
-            "title": "General IT Professional",
-            "match_score": 0.0,
-            "description": "Consider adding more technical skills to your resume for better career matching.",
-            "salary_range": {"min": None, "max": None, "formatted": "Not specified"},
-            "growth_outlook": "Average (5-7% growth projected)",
-            "job_market_demand": "Medium",
-            "skills": {"matching": [], "missing": [], "matching_preferred": [], "missing_preferred": []},
-            "education": [],
-            "certifications": [],
-            "experience_levels": {},
-            "current_experience_level": experience_level
-        }]
-    
-    # Load career data
-    career_data = load_career_data()
+        return [_no_skills_suggestion(experience_level)]
+    
+    # Load career data and accumulate required-skill hits and score per career via the index,
+    # so careers that can't reach min_required_skills or min_match_threshold are never scored
+    career_data, skill_index, profiles = _career_skill_index()
+    hits = defaultdict(int)
+    required_scores = defaultdict(float)
+    for skill in resume_skills:
+        for career_id, occurrences, share in skill_index.get(skill, ()):
+            hits[career_id] += occurrences
+            required_scores[career_id] += share
+    
+    # Careers matching the user's interests (if specified), looked up per interest
+    interested = frozenset().union(
+        *(_careers_for_interest(interest.lower()) for interest in career_interests)
+    ) if career_interests else None
     
     suggestions = []
     for career_id, career_info in career_data.items():
-        # Skip if career doesn't match user's interests (if specified)
-        if career_interests and not any(
-            interest.lower() in career_info['title'].lower() or 
-            any(interest.lower() in skill.lower() for skill in career_info['required_skills'])
-            for interest in career_interests
-        ):
+        if hits[career_id] < min_required_skills:
+            continue
+        if interested is not None and career_id not in interested:
+            continue
+        
+        # Upper bound: the required-skill score plus the full preferred-skill bonus
+        best_score = required_scores[career_id] + (0.15 if profiles[career_id].preferred else 0)
+        if min(best_score, 1.0) + _SCORE_EPSILON < min_match_threshold:
             continue
             
         # Calculate match score and get skill analysis
-        match_score, skill_analysis, _ = calculate_match_score(set(resume_skills), career_info)
+        if not career_info.get('required_skills'):
+            match_score, skill_analysis = 0.0, {"matching": [], "missing": [], "preferred": []}
+        else:
+            match_score, skill_analysis, _ = _match_score(resume_skills, profiles[career_id])
         
         # Skip if below minimum thresholds
         if (match_score < min_match_threshold or 
@@ -461,41 +505,32 @@ def suggest_career_paths(
         if experience_level in exp_levels and experience_level != 'entry':
             match_score = min(match_score * 1.1, 1.0)
         
-        # Create career suggestion
-        suggestion = CareerSuggestion(
-            title=career_info['title'],
-            match_score=min(match_score * 100, 100),  # Convert to percentage
-            required_skills=career_info.get('required_skills', []),
-            matching_skills=skill_analysis.get('matching', []),
-            missing_skills=skill_analysis.get('missing', []),
-            description=career_info.get('description', ''),
-            salary_range=career_info.get('salary_range'),
-            growth_outlook=career_info.get('growth_outlook', 'Not specified'),
-            education=career_info.get('education', []),
-            certifications=career_info.get('certifications', [])
-        )
-        
-        # Add additional metadata
-        setattr(suggestion, 'preferred_skills', career_info.get('preferred_skills', []))
-        setattr(suggestion, 'matching_preferred_skills', skill_analysis.get('preferred', []))
-        setattr(suggestion, 'missing_preferred_skills', skill_analysis.get('missing_preferred', []))
-        setattr(suggestion, 'job_market_demand', career_info.get('job_market_demand', 'Medium'))
-        setattr(suggestion, 'experience_levels', exp_levels)
-        setattr(suggestion, 'current_experience_level', experience_level)
-        
-        suggestions.append(suggestion)
-    
-    # Sort by match score (descending) and then by number of matching skills
-    suggestions.sort(
-        key=lambda x: (
-            x.match_score, 
-            len(x.matching_skills) + len(getattr(x, 'matching_preferred_skills', [])) * 0.5
-        ), 
-        reverse=True
-    )
+        # Build the UI-ready suggestion directly, keyed for sorting. Containers are
+        # copied out of the cached career data so callers can't corrupt later calls
+        matching_skills = skill_analysis.get('matching', [])
+        matching_preferred = skill_analysis.get('preferred', [])
+        match_score = min(match_score * 100, 100)  # Convert to percentage
+        suggestions.append(((match_score, len(matching_skills) + len(matching_preferred) * 0.5), {
+            "title": career_info['title'],
+            "match_score": round(match_score, 1),
+            "description": career_info.get('description', ''),
+            "salary_range": dict(profiles[career_id].salary_range),
+            "growth_outlook": career_info.get('growth_outlook', 'Not specified'),
+            "job_market_demand": career_info.get('job_market_demand', 'Medium'),
+            "skills": {
+                "matching": matching_skills,
+                "missing": skill_analysis.get('missing', []),
+                "matching_preferred": matching_preferred,
+                "missing_preferred": skill_analysis.get('missing_preferred', [])
+            },
+            "education": list(career_info.get('education', [])),
+            "certifications": list(career_info.get('certifications', [])),
+            "experience_levels": dict(exp_levels),
+            "current_experience_level": experience_level
+        }))
     
-    # Format suggestions for UI and limit to top N
-    return [format_career_suggestion(s) for s in suggestions[:top_n]]
+    # Top N by match score (descending) and then by number of matching skills
+    return [suggestion for _, suggestion in heapq.nlargest(top_n, suggestions, key=itemgetter(0))]
 
 def get_skill_development_plan(resume_text: str, target_role: str) -> Dict[str, Any]:
     """
@@ -517,7 +552,7 @@ def get_skill_development_plan(resume_text: str, target_role: str) -> Dict[str,
     if not resume_text or not target_role:
         return {"error": "Resume text and target role are required"}
         
-    resume_skills = list({skill.lower() for skill in extract_skills(resume_text)})
+    resume_skills = extract_skills(resume_text)
     career_data = load_career_data()
     
     # Format the response to be UI-friendly
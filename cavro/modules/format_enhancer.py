@@ -6,7 +6,6 @@ import logging
 from datetime import datetime
 
 # Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class TemplateStyle(Enum):
@@ -86,7 +85,7 @@ class ResumeFormatter:
         """Add a section to the resume."""
         section = ResumeSection.from_text(section_name)
         if section is None:
-            logger.warning(f"Unknown section: {section_name}. Adding as custom section.")
+            logger.warning("Unknown section: %s. Adding as custom section.", section_name)
             section_name = section_name.strip()
         else:
             section_name = section.value
@@ -125,7 +124,7 @@ class ResumeFormatter:
         try:
             template_style = TemplateStyle[template.upper()]
         except KeyError:
-            logger.warning(f"Unknown template: {template}. Using 'professional' instead.")
+            logger.warning("Unknown template: %s. Using 'professional' instead.", template)
             template_style = TemplateStyle.PROFESSIONAL
         
         # Start building the formatted resume
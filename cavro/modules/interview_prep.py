@@ -1,17 +1,23 @@
 import re
 import logging
 import random
-from typing import List, Dict, Set, Optional, Tuple
+from typing import List, Dict, Set, Optional, Tuple, Union
 from dataclasses import dataclass
 from collections import defaultdict
 import json
 from pathlib import Path
+from .utils import ResumeFeatures, as_features, contains_phrase
 
 # Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+@dataclass(slots=True)
 class InterviewQuestion:
     """Represents an interview question with metadata."""
     question: str
@@ -27,10 +33,9 @@ def load_question_bank() -> Dict[str, Dict[str, List[Dict]]]:
         # Try to load from a data file if it exists
         data_file = Path(__file__).parent.parent / 'data' / 'interview_questions.json'
         if data_file.exists():
-            with open(data_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _loads(data_file.read_bytes())
     except Exception as e:
-        logger.warning(f"Failed to load question bank: {str(e)}. Using default questions.")
+        logger.warning("Failed to load question bank: %s. Using default questions.", e)
     
     # Default question bank if file loading fails
     return {
@@ -135,8 +140,8 @@ def load_question_bank() -> Dict[str, Dict[str, List[Dict]]]:
         ]
     }
 
-def extract_technologies(resume_text: str) -> Dict[str, List[str]]:
-    """Extract technologies and skills from resume text."""
+def extract_technologies(resume_text: Union[str, ResumeFeatures]) -> Dict[str, List[str]]:
+    """Extract technologies and skills from resume text (or pre-tokenized features)."""
     if not resume_text:
         return {}
     
@@ -164,20 +169,19 @@ def extract_technologies(resume_text: str) -> Dict[str, List[str]]:
         }
     }
     
-    # Convert resume to lowercase for case-insensitive matching
-    text_lower = resume_text.lower()
+    features = as_features(resume_text)
     
     # Find matching technologies in each category
     technologies = {}
     for category, tech_set in tech_categories.items():
-        found = [tech for tech in tech_set if re.search(r'\b' + re.escape(tech) + r'\b', text_lower)]
+        found = [tech for tech in tech_set if contains_phrase(features, tech)]
         if found:
             technologies[category] = found
     
     return technologies
 
 def generate_questions(
-    resume_text: str,
+    resume_text: Union[str, ResumeFeatures],
     num_questions: int = 10,
     difficulty: str = "all",
     categories: Optional[List[str]] = None
@@ -186,7 +190,7 @@ def generate_questions(
     Generate interview questions based on the resume content.
     
     Args:
-        resume_text: Text content of the resume
+        resume_text: Text content of the resume, or its pre-tokenized ResumeFeatures
         num_questions: Number of questions to generate
         difficulty: Filter by difficulty level ('beginner', 'intermediate', 'advanced', 'all')
         categories: List of categories to include (e.g., ['programming', 'algorithms', 'system_design'])
@@ -194,16 +198,17 @@ def generate_questions(
     Returns:
         List of InterviewQuestion objects
     """
-    if not resume_text or not isinstance(resume_text, str):
+    if not resume_text or not isinstance(resume_text, (str, ResumeFeatures)):
         logger.warning("Invalid resume text provided")
         return []
+    features = as_features(resume_text)
     
     # Load question bank
     question_bank = load_question_bank()
     
     # Extract technologies from resume
-    technologies = extract_technologies(resume_text)
-    logger.info(f"Extracted technologies: {technologies}")
+    technologies = extract_technologies(features)
+    logger.info("Extracted technologies: %s", technologies)
     
     # Collect relevant questions based on technologies
     relevant_questions = []
@@ -238,9 +243,9 @@ def generate_questions(
             ])
     
     # 3. Add system design questions for senior roles
-    experience_match = re.search(r'(\d+\+?\s*(years?|yrs?)\.?\s+.*?experience)', resume_text, re.IGNORECASE)
+    experience_match = re.search(r'(\d+\+?\s*(years?|yrs?)\.?\s+.*?experience)', features.text, re.IGNORECASE)
     senior_keywords = {'senior', 'lead', 'principal', 'architect', 'manager', 'director', 'head of'}
-    has_senior_role = any(keyword in resume_text.lower() for keyword in senior_keywords)
+    has_senior_role = any(keyword in features.lower for keyword in senior_keywords)
     
     if has_senior_role or (experience_match and int(re.search(r'\d+', experience_match.group(1)).group()) >= 3):
         relevant_questions.extend([
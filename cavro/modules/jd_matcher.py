@@ -1,4 +1,4 @@
-from typing import Dict, List, Tuple, Optional, Any, Union
+from typing import Dict, List, Set, Tuple, Optional, Any, Union
 import re
 import numpy as np
 from dataclasses import dataclass
@@ -8,9 +8,13 @@ from collections import Counter
 import math
 
 # Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+try:
+    from config.settings import JD_MATCHING_SETTINGS
+except ImportError:
+    JD_MATCHING_SETTINGS = {"keyword_weight": 0.6, "semantic_weight": 0.4}
+
 # Try to import optional dependencies
 SEMANTIC_MATCHING_AVAILABLE = False
 model = None
@@ -93,7 +97,7 @@ def _preprocess_text(text: str) -> str:
         
         return text
     except Exception as e:
-        logger.warning(f"Error preprocessing text: {str(e)}")
+        logger.warning("Error preprocessing text: %s", e)
         return ""
 
 def _extract_key_phrases(text: str, top_n: int = 10) -> List[str]:
@@ -150,10 +154,41 @@ def _extract_key_phrases(text: str, top_n: int = 10) -> List[str]:
         return [phrase for phrase, _ in sorted_phrases[:top_n]]
         
     except Exception as e:
-        logger.warning(f"Error extracting key phrases: {str(e)}")
+        logger.warning("Error extracting key phrases: %s", e)
         # Fallback: return first few sentences
         return [s.strip() for s in re.split(r'[.!?]', text)[:top_n] if s.strip()]
 
+# Words ignored when comparing resume and JD vocabulary
+_STOPWORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'he',
+    'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the', 'to', 'was', 'were',
+    'will', 'with', 'i', 'me', 'my', 'we', 'our', 'you', 'your', 'they', 'them',
+    'their', 'this', 'these', 'those', 'am', 'is', 'are', 'was', 'were', 'be',
+    'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'shall', 'will',
+    'should', 'would', 'may', 'might', 'must', 'can', 'could', 'having', 'doing',
+    'but', 'if', 'or', 'because', 'until', 'while', 'about', 'against', 'between',
+    'into', 'through', 'during', 'before', 'after', 'above', 'below', 'up', 'down',
+    'out', 'off', 'over', 'under', 'again', 'further', 'then', 'once', 'here',
+    'there', 'when', 'where', 'why', 'how', 'all', 'any', 'both', 'each', 'few',
+    'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'not', 'only', 'own',
+    'same', 'so', 'than', 'too', 'very', 's', 't', 'just', 'don', "don't",
+    "should've", 'now', 'd', 'll', 'm', 'o', 're', 've', 'y', 'ain', 'aren',
+    "aren't", 'couldn', "couldn't", 'didn', "didn't", 'doesn', "doesn't",
+    'hadn', "hadn't", 'hasn', "hasn't", 'haven', "haven't", 'isn', "isn't",
+    'ma', 'mightn', "mightn't", 'mustn', "mustn't", 'needn', "needn't", 'shan',
+    "shan't", 'shouldn', "shouldn't", 'wasn', "wasn't", 'weren', "weren't",
+    'won', "won't", 'wouldn', "wouldn't"
+})
+
+_WORD_RE = re.compile(r'\b\w+\b')
+
+def _keyword_set(text: str, stopwords: set, min_word_length: int) -> Set[str]:
+    """Return the distinct lowercase words of text, minus stopwords, short words and numbers."""
+    return {
+        word for word in set(_WORD_RE.findall(text.lower()))
+        if len(word) >= min_word_length and word not in stopwords and not word.isdigit()
+    }
+
 def _calculate_keyword_overlap(
     resume_text: str, 
     jd_text: str,
@@ -175,45 +210,13 @@ def _calculate_keyword_overlap(
     if not resume_text or not jd_text:
         return 0.0, [], []
         
-    # Default stopwords if not provided
     if stopwords is None:
-        stopwords = {
-            'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'he',
-            'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the', 'to', 'was', 'were',
-            'will', 'with', 'i', 'me', 'my', 'we', 'our', 'you', 'your', 'they', 'them',
-            'their', 'this', 'these', 'those', 'am', 'is', 'are', 'was', 'were', 'be',
-            'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'shall', 'will',
-            'should', 'would', 'may', 'might', 'must', 'can', 'could', 'having', 'doing',
-            'but', 'if', 'or', 'because', 'until', 'while', 'about', 'against', 'between',
-            'into', 'through', 'during', 'before', 'after', 'above', 'below', 'up', 'down',
-            'out', 'off', 'over', 'under', 'again', 'further', 'then', 'once', 'here',
-            'there', 'when', 'where', 'why', 'how', 'all', 'any', 'both', 'each', 'few',
-            'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'not', 'only', 'own',
-            'same', 'so', 'than', 'too', 'very', 's', 't', 'just', 'don', "don't",
-            "should've", 'now', 'd', 'll', 'm', 'o', 're', 've', 'y', 'ain', 'aren',
-            "aren't", 'couldn', "couldn't", 'didn', "didn't", 'doesn', "doesn't",
-            'hadn', "hadn't", 'hasn', "hasn't", 'haven', "haven't", 'isn', "isn't",
-            'ma', 'mightn', "mightn't", 'mustn', "mustn't", 'needn', "needn't", 'shan',
-            "shan't", 'shouldn', "shouldn't", 'wasn', "wasn't", 'weren', "weren't",
-            'won', "won't", 'wouldn', "wouldn't"
-        }
+        stopwords = _STOPWORDS
     
     try:
-        # Tokenize and clean resume text
-        resume_words = set(
-            word.lower() for word in re.findall(r'\b\w+\b', resume_text)
-            if (word.lower() not in stopwords and 
-                len(word) >= min_word_length and
-                not word.isdigit())
-        )
-        
-        # Tokenize and clean job description text
-        jd_words = set(
-            word.lower() for word in re.findall(r'\b\w+\b', jd_text)
-            if (word.lower() not in stopwords and 
-                len(word) >= min_word_length and
-                not word.isdigit())
-        )
+        # Tokenize and clean both texts (lowercased once, deduplicated before filtering)
+        resume_words = _keyword_set(resume_text, stopwords, min_word_length)
+        jd_words = _keyword_set(jd_text, stopwords, min_word_length)
         
         # Calculate exact matches
         exact_matches = resume_words.intersection(jd_words)
@@ -248,9 +251,98 @@ def _calculate_keyword_overlap(
         return match_score, sorted(list(exact_matches)), sorted(list(missing_keywords))
         
     except Exception as e:
-        logger.warning(f"Error calculating keyword overlap: {str(e)}")
+        logger.warning("Error calculating keyword overlap: %s", e)
         return 0.0, [], []
 
+def _split_sentences(text: str) -> List[str]:
+    """Split text into sentences/lines long enough to carry meaning."""
+    return [s.strip() for s in re.split(r'[.!?\n]+', text) if len(s.split()) > 3]
+
+def _embed(texts: List[str], model: Any) -> np.ndarray:
+    """
+    Encode texts in a single batched call.
+    
+    Args:
+        texts: Texts to encode
+        model: Loaded sentence-transformers model
+        
+    Returns:
+        Array of L2-normalized embeddings, one row per text
+    """
+    return model.encode(
+        texts,
+        batch_size=32,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+        show_progress_bar=False
+    )
+
+def _semantic_match(
+    resume_text: str,
+    jd_text: str,
+    keywords: Optional[List[str]] = None,
+    model: Optional[Any] = None,
+    threshold: float = 0.6
+) -> Tuple[List[Dict[str, Any]], float, List[str]]:
+    """
+    Compare resume and job description sentences (and optionally keywords) by embedding similarity.
+    
+    Args:
+        resume_text: Text content from the resume
+        jd_text: Text content from the job description
+        keywords: Job description keywords to check for semantic coverage in the resume
+        model: Optional pre-loaded model (defaults to the module-level one)
+        threshold: Similarity threshold for considering a match (0-1)
+        
+    Returns:
+        Tuple of (sentence matches, semantic score in 0-1, keywords covered semantically)
+    """
+    current_model = model or globals().get('model')
+    if not SEMANTIC_MATCHING_AVAILABLE or current_model is None:
+        logger.debug("Semantic matching not available, using keyword matching only")
+        return [], 0.0, []
+    
+    jd_sentences = _split_sentences(jd_text)
+    resume_sentences = _split_sentences(resume_text)
+    if not jd_sentences or not resume_sentences:
+        return [], 0.0, []
+    keywords = keywords or []
+    
+    try:
+        # One batch for everything; rows are normalized so dot product == cosine
+        emb = _embed(resume_sentences + jd_sentences + keywords, current_model)
+        n_resume, n_jd = len(resume_sentences), len(jd_sentences)
+        resume_emb = emb[:n_resume]
+        jd_emb = emb[n_resume:n_resume + n_jd]
+        kw_emb = emb[n_resume + n_jd:]
+        
+        sims = jd_emb @ resume_emb.T
+        best = sims.argmax(axis=1)
+        best_sims = sims[np.arange(n_jd), best]
+        semantic_score = float(np.clip(best_sims, 0.0, 1.0).mean())
+        
+        matches = [
+            {
+                'jd_sentence': jd_sentences[i],
+                'resume_sentence': resume_sentences[best[i]],
+                'similarity': float(best_sims[i]),
+                'is_fallback': False
+            }
+            for i in np.argsort(-best_sims)
+            if best_sims[i] >= threshold
+        ][:20]
+        
+        covered = []
+        if keywords:
+            kw_sims = (kw_emb @ resume_emb.T).max(axis=1)
+            covered = [keywords[i] for i in np.argsort(-kw_sims) if kw_sims[i] >= threshold]
+        
+        return matches, semantic_score, covered
+        
+    except Exception as e:
+        logger.error("Error in semantic similarity calculation: %s", e)
+        return [], 0.0, []
+
 def _calculate_semantic_similarity(
     resume_text: str, 
     jd_text: str,
@@ -269,84 +361,7 @@ def _calculate_semantic_similarity(
     Returns:
         List of dictionaries containing match information
     """
-    # If semantic matching is not available, return empty list
-    if not SEMANTIC_MATCHING_AVAILABLE:
-        logger.debug("Semantic matching not available, using simple keyword matching")
-        return []
-        
-    # Use the provided model or the global one if available
-    current_model = model or globals().get('model')
-    
-    # If still no model, use simple keyword matching
-    if current_model is None:
-        logger.debug("No model available, using simple keyword matching")
-        return []
-        
-    try:
-        # Import nltk inside the function to avoid dependency issues
-        try:
-            from nltk.tokenize import sent_tokenize
-        except ImportError:
-            logger.warning("NLTK not available. Install with: pip install nltk")
-            return []
-        
-        # Try to download NLTK data if not available
-        try:
-            sent_tokenize("Test sentence.")
-        except LookupError:
-            try:
-                import nltk
-                nltk.download('punkt')
-            except Exception as e:
-                logger.warning(f"Failed to download NLTK data: {str(e)}")
-                return []
-        
-        # Tokenize into sentences
-        jd_sentences = [s for s in sent_tokenize(jd_text) if len(s.split()) > 3]  # Filter out very short sentences
-        resume_sentences = [s for s in sent_tokenize(resume_text) if len(s.split()) > 3]
-        
-        if not jd_sentences or not resume_sentences:
-            return []
-            
-        try:
-            # We already have current_model from the function start
-            matches = []
-            for jd_sent in jd_sentences:
-                for resume_sent in resume_sentences:
-                    # Simple word overlap as fallback
-                    jd_words = set(jd_sent.lower().split())
-                    resume_words = set(resume_sent.lower().split())
-                    common_words = jd_words.intersection(resume_words)
-                    
-                    if len(common_words) > 0:
-                        # Simple scoring based on word overlap
-                        similarity = len(common_words) / max(len(jd_words), 1)
-                        if similarity >= threshold:
-                            matches.append({
-                                'jd_sentence': jd_sent,
-                                'resume_sentence': resume_sent,
-                                'similarity': similarity,
-                                'is_fallback': True
-                            })
-            
-            # Sort by similarity score and remove duplicates
-            seen = set()
-            unique_matches = []
-            for match in sorted(matches, key=lambda x: x['similarity'], reverse=True):
-                key = (match['jd_sentence'], match['resume_sentence'])
-                if key not in seen:
-                    seen.add(key)
-                    unique_matches.append(match)
-            
-            return unique_matches[:20]  # Return top 20 matches
-            
-        except Exception as e:
-            logger.error(f"Error in semantic encoding: {str(e)}")
-            return []
-        
-    except Exception as e:
-        logger.error(f"Error in semantic similarity calculation: {str(e)}")
-        return []
+    return _semantic_match(resume_text, jd_text, model=model, threshold=threshold)[0]
 
 def match_resume_to_jd(
     resume_text: str, 
@@ -388,25 +403,41 @@ def match_resume_to_jd(
         
         # Calculate semantic matches if enabled and available
         semantic_matches = []
+        semantic_score = 0.0
         if use_semantic_matching:
             try:
-                semantic_matches = _calculate_semantic_similarity(
+                semantic_matches, semantic_score, covered = _semantic_match(
                     resume_text, 
                     jd_text,
+                    keywords=missing_keywords,
                     model=model,
                     threshold=semantic_threshold
                 )
             except Exception as e:
-                logger.warning(f"Error during semantic matching: {str(e)}")
-                semantic_matches = []
+                logger.warning("Error during semantic matching: %s", e)
+                semantic_matches, covered = [], []
+            
+            # Keywords phrased differently in the resume count as matched
+            if covered:
+                covered_set = set(covered)
+                keyword_overlap = keyword_overlap + covered
+                missing_keywords = [kw for kw in missing_keywords if kw not in covered_set]
                 
             # If we didn't get any semantic matches, log it for debugging
-            if not semantic_matches and resume_text and jd_text:
+            if not semantic_score and resume_text and jd_text:
                 logger.debug("No semantic matches found, using keyword matching only")
                 use_semantic_matching = False
                 
         # Calculate overall score (weighted average of keyword and semantic scores)
-        overall_score = keyword_score * 100  # Convert to percentage
+        if use_semantic_matching:
+            overall_score = (
+                JD_MATCHING_SETTINGS["keyword_weight"] * keyword_score +
+                JD_MATCHING_SETTINGS["semantic_weight"] * semantic_score
+            ) * 100
+        else:
+            overall_score = keyword_score * 100  # Convert to percentage
+        
+        feedback = []
         
         # Keyword feedback
         if keyword_score >= 0.7:
@@ -426,7 +457,7 @@ def match_resume_to_jd(
         
         # Semantic feedback
         if semantic_matches:
-            top_matches = [m for m in semantic_matches if m.get('similarity_score', 0) >= 0.8]
+            top_matches = [m for m in semantic_matches if m.get('similarity', 0) >= 0.8]
             if top_matches:
                 feedback.append(f"✨ Found {len(top_matches)} highly relevant experience matches.")
             
@@ -442,7 +473,7 @@ def match_resume_to_jd(
         feedback.append("💡 Tip: Tailor your resume to include more keywords from the job description.")
         
         return MatchResult(
-            match_score=min(100, int(overall_score * 100)),  # Ensure score is 0-100
+            match_score=min(100.0, overall_score),  # Ensure score is 0-100
             keyword_overlap=keyword_overlap[:20],  # Limit to top 20 keywords
             missing_keywords=missing_keywords,
             semantic_matches=semantic_matches,
@@ -450,7 +481,7 @@ def match_resume_to_jd(
         )
         
     except Exception as e:
-        logger.error(f"Error matching resume to job description: {str(e)}")
+        logger.error("Error matching resume to job description: %s", e)
         return MatchResult(
             match_score=0.0,
             keyword_overlap=[],
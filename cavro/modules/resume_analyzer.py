@@ -269,7 +269,7 @@ def extract_education(text: str) -> List[dict]:
         
         return education
     except Exception as e:
-        logger.error(f"Error extracting education: {str(e)}")
+        logger.error("Error extracting education: %s", e)
         return []
 
 def extract_experience(text: str) -> List[dict]:
@@ -356,7 +356,7 @@ def extract_experience(text: str) -> List[dict]:
         
         return experience
     except Exception as e:
-        logger.error(f"Error extracting experience: {str(e)}")
+        logger.error("Error extracting experience: %s", e)
         return []
 
 def analyze_resume(text: str) -> ResumeData:
@@ -397,7 +397,7 @@ def analyze_resume(text: str) -> ResumeData:
         return resume_data
         
     except Exception as e:
-        logger.error(f"Error analyzing resume: {str(e)}")
+        logger.error("Error analyzing resume: %s", e)
         # Return partial data if available
         return resume_data
 
@@ -5,6 +5,7 @@ from typing import Dict, List, Tuple, Optional
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
+from config.settings import ATS_SCORING_SETTINGS
 from .resume_parser import parse_resume, clean_resume_text
 
 class ResumeComparator:
@@ -15,8 +16,17 @@ class ResumeComparator:
             samples_dir: Directory containing subdirectories of sample resumes by role
         """
         self.samples_dir = Path(samples_dir)
-        self.vectorizer = TfidfVectorizer(stop_words='english')
+        self.vectorizer = TfidfVectorizer(
+            stop_words='english',
+            max_features=ATS_SCORING_SETTINGS["max_keywords_considered"] * 10,
+            dtype=np.float32,
+            sublinear_tf=True
+        )
         self.sample_data = self._load_sample_resumes()
+        # Flat views over sample_data: one CSR row per sample plus parallel role/path lists
+        self._sample_matrix = None
+        self._sample_roles: List[str] = []
+        self._sample_paths: List[str] = []
         self._fit_vectorizer()
     
     def _load_sample_resumes(self) -> Dict[str, List[Dict]]:
@@ -44,13 +54,17 @@ class ResumeComparator:
         return sample_data
     
     def _fit_vectorizer(self):
-        """Fit the TF-IDF vectorizer on all sample resumes."""
+        """Fit the TF-IDF vectorizer on all sample resumes and vectorize them once."""
         all_texts = []
         for role_samples in self.sample_data.values():
-            all_texts.extend([s['text'] for s in role_samples])
+            for sample in role_samples:
+                all_texts.append(sample['text'])
+                self._sample_roles.append(sample['role'])
+                self._sample_paths.append(sample['path'])
         
         if all_texts:
-            self.vectorizer.fit(all_texts)
+            # Rows are L2-normalized, so a dot product against them is the cosine similarity
+            self._sample_matrix = self.vectorizer.fit_transform(all_texts)
     
     def compare_to_samples(self, resume_text: str, top_n: int = 3) -> List[Dict]:
         """Compare the given resume text to all sample resumes.
@@ -65,21 +79,23 @@ class ResumeComparator:
         if not resume_text or not resume_text.strip():
             return []
         
+        if self._sample_matrix is None:
+            return []
+        
         # Clean and vectorize the input resume
         cleaned_text = clean_resume_text(resume_text)
         input_vec = self.vectorizer.transform([cleaned_text])
         
-        # Calculate similarity with all samples
-        similarities = []
-        for role, samples in self.sample_data.items():
-            for sample in samples:
-                sample_vec = self.vectorizer.transform([sample['text']])
-                similarity = cosine_similarity(input_vec, sample_vec)[0][0]
-                similarities.append({
-                    'similarity': float(similarity),
-                    'role': role,
-                    'sample_path': sample['path']
-                })
+        # Calculate similarity with all samples in one sparse product
+        scores = (input_vec @ self._sample_matrix.T).toarray()[0]
+        similarities = [
+            {
+                'similarity': float(score),
+                'role': role,
+                'sample_path': path
+            }
+            for score, role, path in zip(scores, self._sample_roles, self._sample_paths)
+        ]
         
         # Sort by similarity (descending) and return top_n
         similarities.sort(key=lambda x: x['similarity'], reverse=True)
@@ -104,23 +120,21 @@ class ResumeComparator:
         samples_to_compare = []
         if target_role and target_role in self.sample_data:
             samples_to_compare = self.sample_data[target_role]
+            rows = [i for i, role in enumerate(self._sample_roles) if role == target_role]
         else:
             # Otherwise use all samples
             samples_to_compare = [s for role_samples in self.sample_data.values() for s in role_samples]
+            rows = list(range(len(self._sample_roles)))
         
-        if not samples_to_compare:
+        if not samples_to_compare or self._sample_matrix is None:
             return {"error": "No sample resumes available for comparison"}
         
-        # Vectorize the input and samples
-        all_texts = [s['text'] for s in samples_to_compare] + [cleaned_text]
-        vectors = self.vectorizer.fit_transform(all_texts)
-        
-        # Calculate average vector for samples
-        sample_vectors = vectors[:-1]
-        avg_sample_vector = sample_vectors.mean(axis=0)
+        # Reuse the precomputed sample rows; only the input is vectorized
+        sample_vectors = self._sample_matrix[rows]
+        avg_sample_vector = np.asarray(sample_vectors.mean(axis=0))
         
         # Get input vector
-        input_vector = vectors[-1]
+        input_vector = self.vectorizer.transform([cleaned_text])
         
         # Calculate similarity to average sample
         similarity = cosine_similarity(input_vector, avg_sample_vector)[0][0]
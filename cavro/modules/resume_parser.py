@@ -54,26 +54,8 @@ try:
 except ImportError:
     PDF2IMAGE_AVAILABLE = False
 
-# Configure logging with more detailed format
-LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s'
-LOG_LEVEL = logging.INFO
-
-# Create logs directory if it doesn't exist
-os.makedirs('logs', exist_ok=True)
-
-# Configure root logger
-logging.basicConfig(
-    level=LOG_LEVEL,
-    format=LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('logs/resume_parser.log', encoding='utf-8')
-    ]
-)
-
 # Module logger
 logger = logging.getLogger('resume_parser')
-logger.setLevel(LOG_LEVEL)
 
 class FileType(Enum):
     """Supported file types for resume parsing."""
@@ -165,7 +147,7 @@ def detect_file_type(file_obj: BytesIO, file_extension: str) -> FileType:
             return FileType.RTF
             
     except Exception as e:
-        logger.warning(f"Error detecting file type from content: {str(e)}")
+        logger.warning("Error detecting file type from content: %s", e)
         file_obj.seek(0)  # Ensure we reset position on error
     
     # Fall back to extension if content detection fails or file is not seekable
@@ -200,7 +182,7 @@ def extract_metadata(file_obj: BytesIO, file_type: FileType) -> ResumeMetadata:
     Raises:
         ResumeParserError: If there's an error extracting metadata
     """
-    logger.debug(f"Extracting metadata for file type: {file_type}")
+    logger.debug("Extracting metadata for file type: %s", file_type)
     metadata = ResumeMetadata()
     metadata.file_type = file_type
     
@@ -223,7 +205,7 @@ def extract_metadata(file_obj: BytesIO, file_type: FileType) -> ResumeMetadata:
                 try:
                     doc = fitz.open(stream=file_content, filetype='pdf')
                 except Exception as e:
-                    logger.warning(f"Failed to open PDF with PyMuPDF: {str(e)}")
+                    logger.warning("Failed to open PDF with PyMuPDF: %s", e)
                     return metadata
                 
                 # Extract metadata
@@ -244,7 +226,7 @@ def extract_metadata(file_obj: BytesIO, file_type: FileType) -> ResumeMetadata:
                             elif isinstance(keywords, (list, tuple)):
                                 metadata.keywords = [str(k).strip() for k in keywords if k and str(k).strip()]
                 
-                logger.debug(f"Extracted PDF metadata: {metadata}")
+                logger.debug("Extracted PDF metadata: %s", metadata)
                 
             except ImportError:
                 logger.warning("PyMuPDF not available for PDF metadata extraction")
@@ -254,7 +236,7 @@ def extract_metadata(file_obj: BytesIO, file_type: FileType) -> ResumeMetadata:
         metadata.file_size = file_obj.tell()
         file_obj.seek(original_position)  # Reset position
         
-        logger.info(f"Successfully extracted metadata: {metadata}")
+        logger.info("Successfully extracted metadata: %s", metadata)
         
     except Exception as e:
         error_msg = f"Failed to extract metadata: {str(e)}"
@@ -377,7 +359,7 @@ def parse_resume(
                 metadata = extract_metadata(file_obj, file_type)
                 file_obj.seek(0)  # Reset position after metadata extraction
             except Exception as e:
-                logger.warning(f"Error extracting metadata: {str(e)}")
+                logger.warning("Error extracting metadata: %s", e)
                 metadata = ResumeMetadata()
         
         # Parse based on file type
@@ -409,7 +391,7 @@ def parse_resume(
             try:
                 text = clean_resume_text(text)
             except Exception as e:
-                logger.warning(f"Error cleaning text: {str(e)}")
+                logger.warning("Error cleaning text: %s", e)
                 # Continue with uncleaned text rather than failing
         
         return text, metadata
@@ -424,7 +406,7 @@ def parse_resume(
             try:
                 file_obj.close()
             except Exception as e:
-                logger.warning(f"Error closing file object: {str(e)}")
+                logger.warning("Error closing file object: %s", e)
 
 def _parse_pdf(file_obj: Union[BytesIO, BinaryIO]) -> str:
     """
@@ -468,7 +450,7 @@ def _parse_pdf(file_obj: Union[BytesIO, BinaryIO]) -> str:
                     if page_text.strip():
                         text += page_text + "\n"
                 except Exception as page_error:
-                    logger.warning(f"Error on page {page_num + 1}: {str(page_error)}")
+                    logger.warning("Error on page %s: %s", page_num + 1, page_error)
                     continue
             
             # If we got some text, return it
@@ -479,7 +461,7 @@ def _parse_pdf(file_obj: Union[BytesIO, BinaryIO]) -> str:
                 logger.warning("PyMuPDF extracted empty text, trying next method...")
                 
         except Exception as e:
-            logger.warning(f"PyMuPDF text extraction failed: {str(e)}")
+            logger.warning("PyMuPDF text extraction failed: %s", e)
             # Continue to next method
     else:
         logger.warning("PyMuPDF not available, trying next method...")
@@ -570,7 +552,7 @@ def _parse_pdf(file_obj: Union[BytesIO, BinaryIO]) -> str:
             missing_deps.append("pdf2image")
         
         if missing_deps:
-            logger.warning(f"Skipping OCR - Missing dependencies: {', '.join(missing_deps)}")
+            logger.warning("Skipping OCR - Missing dependencies: %s", ', '.join(missing_deps))
             ocr_available = False
         
         # Only attempt OCR if we have the required dependencies
@@ -591,7 +573,7 @@ def _parse_pdf(file_obj: Union[BytesIO, BinaryIO]) -> str:
                                 img_data = pix.tobytes("png")
                                 page_text = _extract_text_with_ocr(img_data, "png") or ""
                             except Exception as ocr_error:
-                                logger.warning(f"OCR on page {page_num + 1} failed: {str(ocr_error)}")
+                                logger.warning("OCR on page %s failed: %s", page_num + 1, ocr_error)
                                 continue
                         text += page_text + "\n\n"
                     
@@ -625,7 +607,7 @@ def _parse_pdf(file_obj: Union[BytesIO, BinaryIO]) -> str:
                             if ocr_text:
                                 text += ocr_text + "\n\n"
                         except Exception as img_error:
-                            logger.warning(f"OCR on image failed: {str(img_error)}")
+                            logger.warning("OCR on image failed: %s", img_error)
                             continue
                     
                     if text.strip():
@@ -790,9 +772,9 @@ def _extract_text_with_ocr(image_data: bytes, file_extension: str) -> str:
         if tesseract_cmd:
             try:
                 pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
-                logger.info(f"Using Tesseract at: {tesseract_cmd}")
+                logger.info("Using Tesseract at: %s", tesseract_cmd)
             except Exception as cfg_err:
-                logger.warning(f"Failed to set Tesseract path: {cfg_err}")
+                logger.warning("Failed to set Tesseract path: %s", cfg_err)
         # Use Tesseract with a general model and layout mode that works well for resumes
         text = pytesseract.image_to_string(img, lang="eng", config="--oem 3 --psm 6")
         return text
@@ -804,7 +786,7 @@ def _extract_text_with_ocr(image_data: bytes, file_extension: str) -> str:
             if os.path.exists(temp_file_path):
                 os.unlink(temp_file_path)
         except Exception as e:
-            logger.warning(f"Failed to delete temporary file {temp_file_path}: {str(e)}")
+            logger.warning("Failed to delete temporary file %s: %s", temp_file_path, e)
 
 def clean_resume_text(text: str) -> str:
     """
@@ -892,9 +874,8 @@ def clean_resume_text(text: str) -> str:
         # Log cleaning results
         cleaned_length = len(text)
         logger.debug(
-            f"Text cleaning complete. Original length: {original_length}, "
-            f"Cleaned length: {cleaned_length}, "
-            f"Removed: {original_length - cleaned_length} characters"
+            "Text cleaning complete. Original length: %d, Cleaned length: %d, Removed: %d characters",
+            original_length, cleaned_length, original_length - cleaned_length
         )
         
         return text.strip()
@@ -3,9 +3,12 @@ import re
 import json
 import logging
 import time
+from datetime import timedelta
+from functools import lru_cache
 from typing import List, Dict, Optional, Union, Any
 from dataclasses import dataclass
 from config import settings
+from .utils import text_lru_cache
 
 # Import Gemini lazily to avoid hard dependency at import time
 try:
@@ -17,17 +20,66 @@ except Exception:
 __all__ = ['rewrite_bullet_point', 'ResumeRewriter', 'RewriteResult']
 
 # Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Constants
 DEFAULT_MODEL = settings.GEMINI_MODEL
 MAX_RETRIES = 3
 DEFAULT_TEMPERATURE = 0.7
+PROMPT_CACHE_TTL = timedelta(hours=2)
+PROMPT_CACHE_REFRESH = 3600  # seconds; refreshed well before the TTL runs out
+
+# Static instructions go in the system prompt so every request shares a
+# byte-identical prefix that Gemini can serve from its context cache; only
+# the style and bullet point vary per call
+REWRITE_SYSTEM_PROMPT = (
+    "You are an expert resume writer with 10+ years of experience helping job seekers land their dream jobs.\n"
+    "Rewrite the resume bullet point you are given to be more impactful, specific, and achievement-oriented.\n"
+    "Focus on using strong action verbs and quantifiable results where possible.\n"
+    "\n"
+    "Please provide your response in this exact format:\n"
+    "\n"
+    "Rewritten: [Your rewritten bullet point here]\n"
+    "\n"
+    "Improvements: [Brief explanation of the improvements made]"
+)
 
 # Initialize Gemini if available and configured
+_configured_key = None
 if _HAS_GENAI and settings.GEMINI_API_KEY:
     genai.configure(api_key=settings.GEMINI_API_KEY)
+    _configured_key = settings.GEMINI_API_KEY
+
+@lru_cache(maxsize=8)
+def _cached_prefix(model: str, period: int) -> Optional[Any]:
+    """
+    Create a Gemini cached-content entry for the system prompt, once per model and refresh period.
+    
+    Returns None when the model or prompt size does not support explicit caching.
+    """
+    try:
+        return genai.caching.CachedContent.create(
+            model=model,
+            display_name="cavro-rewrite-prefix",
+            system_instruction=REWRITE_SYSTEM_PROMPT,
+            ttl=PROMPT_CACHE_TTL
+        )
+    except Exception as e:
+        logger.info("Prompt caching unavailable for %s: %s", model, e)
+        return None
+
+@lru_cache(maxsize=8)
+def _get_client(model: str, period: int) -> Any:
+    """
+    Return the shared Gemini client for a model, built once per prompt-cache refresh period.
+    
+    Every ResumeRewriter for the same model reuses this client (and its open
+    connection) instead of constructing its own.
+    """
+    cached = _cached_prefix(model, period)
+    if cached is not None:
+        return genai.GenerativeModel.from_cached_content(cached_content=cached)
+    return genai.GenerativeModel(model, system_instruction=REWRITE_SYSTEM_PROMPT)
 
 @dataclass
 class RewriteResult:
@@ -61,11 +113,17 @@ class ResumeRewriter:
         if not _HAS_GENAI:
             raise ImportError("google-generativeai is not installed. Install to use AI rewrite.")
 
-        genai.configure(api_key=api_key or settings.GEMINI_API_KEY)
-        self.client = genai.GenerativeModel(self.model)
+        # Reconfigure (and drop clients bound to the old key) only when the key changes
+        global _configured_key
+        key = api_key or settings.GEMINI_API_KEY
+        if key != _configured_key:
+            genai.configure(api_key=key)
+            _get_client.cache_clear()
+            _configured_key = key
+        self.client = _get_client(self.model, int(time.time() // PROMPT_CACHE_REFRESH))
     
     def _generate_rewrite_prompt(self, bullet_point: str, style: str = "professional") -> str:
-        """Generate the prompt for the Gemini model."""
+        """Generate the per-request part of the prompt (the instructions live in the system prompt)."""
         style_instructions = {
             "professional": "Maintain a professional tone suitable for most industries.",
             "ats_optimized": "Optimize for Applicant Tracking Systems with relevant keywords.",
@@ -73,23 +131,8 @@ class ResumeRewriter:
             "technical": "Emphasize technical skills and specific technologies used."
         }.get(style.lower(), "")
         
-        prompt = f"""
-        You are an expert resume writer with 10+ years of experience helping job seekers land their dream jobs.
-        Rewrite the following resume bullet point to be more impactful, specific, and achievement-oriented.
-        Focus on using strong action verbs and quantifiable results where possible.
-        
-        Style: {style_instructions}
-        
-        Original: {bullet_point}
-        
-        Please provide your response in this exact format:
-        
-        Rewritten: [Your rewritten bullet point here]
-        
-        Improvements: [Brief explanation of the improvements made]
-        """
-        
-        return prompt
+        # Trailing whitespace is stripped so identical inputs yield identical requests
+        return f"Style: {style_instructions}\n\nOriginal: {bullet_point.strip()}"
     
     def _parse_ai_response(self, response: Any) -> Dict[str, Any]:
         """Parse the AI response and extract the rewritten content."""
@@ -112,7 +155,7 @@ class ResumeRewriter:
                 "improvements": improvements
             }
         except (AttributeError, IndexError, KeyError) as e:
-            logger.error(f"Error parsing AI response: {str(e)}")
+            logger.error("Error parsing AI response: %s", e)
             raise ValueError("Failed to parse AI response") from e
     
     def _call_ai_api(self, prompt: str, max_tokens: int = 150) -> Any:
@@ -130,9 +173,9 @@ class ResumeRewriter:
                 return response
             except Exception as e:
                 if attempt == MAX_RETRIES - 1:
-                    logger.error(f"API call failed after {MAX_RETRIES} attempts: {str(e)}")
+                    logger.error("API call failed after %s attempts: %s", MAX_RETRIES, e)
                     raise
-                logger.warning(f"API call failed (attempt {attempt + 1}/{MAX_RETRIES}): {str(e)}")
+                logger.warning("API call failed (attempt %s/%s): %s", attempt + 1, MAX_RETRIES, e)
                 time.sleep(1)  # Simple backoff
     
     def rewrite_bullet_point(
@@ -175,7 +218,7 @@ class ResumeRewriter:
             )
             
         except Exception as e:
-            logger.error(f"Error rewriting bullet point: {str(e)}")
+            logger.error("Error rewriting bullet point: %s", e)
             return RewriteResult(
                 original=bullet_point,
                 rewritten="",
@@ -211,7 +254,7 @@ class ResumeRewriter:
                 result = self.rewrite_bullet_point(point, style, max_tokens)
                 results.append(result)
             except Exception as e:
-                logger.error(f"Error processing bullet point: {str(e)}")
+                logger.error("Error processing bullet point: %s", e)
                 results.append(RewriteResult(
                     original=point,
                     rewritten="",
@@ -221,6 +264,7 @@ class ResumeRewriter:
         
         return results
 
+@text_lru_cache(maxsize=settings.CACHE_SETTINGS["max_size"])
 def rewrite_bullet_point(
     bullet_point: str, 
     api_key: Optional[str] = None, 
@@ -239,5 +283,5 @@ def rewrite_bullet_point(
         result = rewriter.rewrite_bullet_point(bullet_point, style=style)
         return result.rewritten if result.success else ""
     except Exception as e:
-        logger.error(f"Error in rewrite_bullet_point: {str(e)}")
+        logger.error("Error in rewrite_bullet_point: %s", e)
         return ""
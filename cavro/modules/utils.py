@@ -2,7 +2,12 @@ import re
 import logging
 import unicodedata
 import os
-from typing import Any, Dict, List, Optional, Union, Callable, TypeVar, Type
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache, wraps
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Union, Callable, TypeVar, Type
 from datetime import datetime, date
 from pathlib import Path
 
@@ -56,6 +61,59 @@ logger = setup_logger()
 
 T = TypeVar('T')
 
+_TOKEN_RE = re.compile(r'\w+')
+
+@dataclass(frozen=True, slots=True)
+class ResumeFeatures:
+    """
+    Resume text together with the normalized views the analyzers share.
+    
+    Attributes:
+        text: Original resume text
+        lower: Lowercased text
+        tokens: Word tokens of the lowercased text, in order
+        token_set: Distinct word tokens, for O(1) membership checks
+    """
+    text: str
+    lower: str
+    tokens: Tuple[str, ...]
+    token_set: FrozenSet[str]
+    
+    @classmethod
+    def from_text(cls, text: str) -> 'ResumeFeatures':
+        """Lowercase and tokenize text in a single pass each."""
+        lower = text.lower()
+        tokens = tuple(_TOKEN_RE.findall(lower))
+        return cls(text, lower, tokens, frozenset(tokens))
+
+def as_features(resume: Union[str, ResumeFeatures]) -> ResumeFeatures:
+    """Return resume as ResumeFeatures, tokenizing it if given raw text."""
+    return resume if isinstance(resume, ResumeFeatures) else ResumeFeatures.from_text(resume or "")
+
+@lru_cache(maxsize=4096)
+def _phrase_pattern(phrase: str) -> re.Pattern:
+    """Compile the word-boundary pattern for a phrase once."""
+    return re.compile(r'\b' + re.escape(phrase) + r'\b')
+
+def contains_phrase(features: ResumeFeatures, phrase: str) -> bool:
+    """
+    Check whether a lowercase phrase occurs in the resume as a whole word or phrase.
+    
+    The phrase's first word must be one of the resume's tokens for it to match,
+    so most misses are settled by a set lookup before any regex runs.
+    
+    Args:
+        features: Tokenized resume
+        phrase: Lowercase word or phrase (may contain symbols, e.g. 'c++')
+        
+    Returns:
+        True if the phrase is found on word boundaries
+    """
+    first = _TOKEN_RE.search(phrase)
+    if first and first.group(0) not in features.token_set:
+        return False
+    return _phrase_pattern(phrase).search(features.lower) is not None
+
 def clean_text(text: str, preserve_case: bool = False) -> str:
     """
     Clean and normalize text by removing extra whitespace and normalizing unicode.
@@ -367,3 +425,44 @@ def truncate_text(text: str, max_length: int = 100, ellipsis: str = '...') -> st
         return ellipsis[:max_length]
     
     return text[:max_length - len(ellipsis)] + ellipsis
+
+def text_lru_cache(maxsize: int = 1000) -> Callable:
+    """
+    Cache an expensive text-in function in an exact-match LRU.
+    
+    Entries are keyed by the SHA-256 of the whitespace-canonicalized text plus the
+    remaining arguments, so reformatted copies of the same text share an entry.
+    Falsy results are not cached so failed calls are retried.
+    
+    Args:
+        maxsize: Maximum number of cached entries
+        
+    Returns:
+        Decorator for functions whose first argument is the text
+    """
+    def decorator(func: Callable) -> Callable:
+        lru = OrderedDict()
+        lock = threading.Lock()
+        
+        @wraps(func)
+        def wrapper(text: str, *args, **kwargs):
+            canonical = ' '.join(text.split()) if isinstance(text, str) else text
+            key = (hashlib.sha256(str(canonical).encode()).hexdigest(), args, tuple(sorted(kwargs.items())))
+            
+            with lock:
+                if key in lru:
+                    lru.move_to_end(key)
+                    return lru[key]
+            
+            result = func(text, *args, **kwargs)
+            if not result:
+                return result
+            
+            with lock:
+                lru[key] = result
+                if len(lru) > maxsize:
+                    lru.popitem(last=False)
+            return result
+        
+        return wrapper
+    return decorator
@@ -0,0 +1,70 @@
+"""
+Regression tests for the ATS score module.
+Run directly (python test_ats_score.py) or with pytest.
+"""
+import random
+import re
+import sys
+from pathlib import Path
+
+# Add the project root to the Python path
+sys.path.insert(0, str(Path(__file__).parent.absolute()))
+
+from modules.ats_score import ATSScorer, _KeywordScanner, _scan_text, calculate_ats_score
+
+def test_work_experience_month_end_date():
+    """A range ending in a month ('Mar 2016 - Dec 2019') used to raise IndexError."""
+    scorer = ATSScorer()
+    experiences = scorer._extract_work_experience(
+        "Mar 2016 - Dec 2019\nSoftware Engineer at Acme Corp\n- Built internal tools\n"
+        "Jan 2020 - present\nSenior Developer at Initech\n- Led a team of 4 engineers"
+    )
+    assert [exp['start_date'] for exp in experiences] == ['Mar 2016', 'Jan 2020']
+    assert [exp['end_date'] for exp in experiences] == ['Dec 2019', 'Present']
+
+    assert 0 <= calculate_ats_score("EXPERIENCE\nMar 2016 - Dec 2019\nSoftware Engineer at Acme Corp") <= 100
+
+def test_education_dotted_degrees():
+    """Dotted degree abbreviations were escaped twice and never matched."""
+    _, _, details = ATSScorer()._score_education("Ph.D. in Physics, B.S. in Mathematics")
+    assert 'Ph.D.' in details['degrees']
+    assert 'B.S.' in details['degrees']
+
+def test_scan_text_all_caps_lines():
+    """Each nonblank all-caps line counts once; blank runs and adjacent headers don't merge."""
+    stats = _scan_text("SUMMARY\nEXPERIENCE\n\n\n\nEDUCATION\nWorked at Acme\n• Shipped features")
+    assert stats['all_caps_lines'] == 3
+    assert stats['line_count'] == 5
+    assert stats['bullet_styles'] == {'•'}
+
+def test_keyword_scanner_matches_per_keyword_search():
+    """find() and count() agree with a per-keyword \\b-bounded search."""
+    keywords = ['python', 'java', 'javascript', 'machine learning', 'learning', 'sql', 'c++', 'node.js', 'r']
+    scanner = _KeywordScanner(keywords)
+    words = ['python', 'java', 'javascript', 'machine', 'learning', 'sql', 'mysql', 'c++', 'node.js',
+             'r', 'rust', 'and', ',', '.', '\n', 'javascripts']
+    rng = random.Random(0)
+    for _ in range(500):
+        text = ''.join(rng.choice(words) + rng.choice(['', ' ', '-', ', ']) for _ in range(rng.randint(0, 12)))
+        expected = {kw for kw in keywords if re.search(rf'\b{re.escape(kw)}\b', text)}
+        positions = {m.start() for kw in keywords for m in re.finditer(rf'(?=\b{re.escape(kw)}\b)', text)}
+        assert scanner.find(text) == expected, text
+        assert scanner.count(text) == len(positions), text
+
+def run_tests():
+    """Run all test cases."""
+    tests = [(name, func) for name, func in globals().items() if name.startswith('test_') and callable(func)]
+    failed = 0
+    for name, func in tests:
+        try:
+            func()
+            print(f"[PASS] {name}")
+        except Exception as e:
+            failed += 1
+            print(f"[FAIL] {name}: {e}")
+
+    print(f"\nPassed: {len(tests) - failed}/{len(tests)} tests")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    run_tests()
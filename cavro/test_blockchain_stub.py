@@ -0,0 +1,40 @@
+"""
+Regression tests for the blockchain stub module.
+Run directly (python test_blockchain_stub.py) or with pytest.
+"""
+import sys
+from pathlib import Path
+
+# Add the project root to the Python path
+sys.path.insert(0, str(Path(__file__).parent.absolute()))
+
+from modules.blockchain_stub import Blockchain
+
+def test_is_chain_valid_detects_tampering():
+    """Editing an already-validated block is caught by the default (full) check."""
+    blockchain = Blockchain(difficulty=1)
+    blockchain.verify_resume("Jane Doe - Python developer")
+    blockchain.verify_resume("John Roe - Data analyst")
+    assert blockchain.is_chain_valid()
+    assert blockchain.is_chain_valid(incremental=True)
+
+    blockchain.chain[1].data = {"tampered": True}
+    assert not blockchain.is_chain_valid()
+
+def run_tests():
+    """Run all test cases."""
+    tests = [(name, func) for name, func in globals().items() if name.startswith('test_') and callable(func)]
+    failed = 0
+    for name, func in tests:
+        try:
+            func()
+            print(f"[PASS] {name}")
+        except Exception as e:
+            failed += 1
+            print(f"[FAIL] {name}: {e}")
+
+    print(f"\nPassed: {len(tests) - failed}/{len(tests)} tests")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,66 @@
+"""
+Regression tests for the career suggestions module.
+Run directly (python test_career_suggestions.py) or with pytest.
+"""
+import sys
+from pathlib import Path
+
+# Add the project root to the Python path
+sys.path.insert(0, str(Path(__file__).parent.absolute()))
+
+from modules.career_suggestions import extract_skills, suggest_career_paths
+
+def test_extract_skills_with_symbols():
+    """Skills that start or end with a symbol are found next to spaces and punctuation."""
+    text = "Skills: C++ and C# developer. Experience:\n- Built apps in C++ and C# with Java"
+    assert extract_skills(text) == {'c++', 'c#', 'java'}
+
+    skills = extract_skills("Shipped ASP.NET services, Node.js tooling and CI/CD pipelines.")
+    assert {'asp.net', 'node.js', 'ci/cd'} <= skills
+
+def test_extract_skills_whole_words():
+    """Skills are not matched inside longer words."""
+    assert extract_skills("Worked on javascript frontends") == {'javascript'}
+    assert 'r' not in extract_skills("Experience:\n- Reporting for the rust team")
+
+def test_suggest_career_paths_skill_names():
+    """Formatting used to unpack each matching skill name as a (skill, relevance) pair."""
+    resume = "Data scientist with Python, SQL, machine learning, pandas, numpy and statistics experience."
+    suggestions = suggest_career_paths(resume, top_n=3)
+    assert suggestions
+    for suggestion in suggestions:
+        assert 0 <= suggestion['match_score'] <= 100
+        assert all(isinstance(skill, str) for skill in suggestion['skills']['matching'])
+
+def test_suggestions_are_independent_copies():
+    """Mutating a returned suggestion must not leak into later calls through the cached career data."""
+    resume = "Data scientist with Python, SQL, machine learning, pandas, numpy and statistics experience."
+    first = suggest_career_paths(resume, top_n=1)[0]
+    first['education'].append('Tampered')
+    first['certifications'].clear()
+    first['salary_range']['formatted'] = 'Tampered'
+    first['experience_levels']['entry'] = 'Tampered'
+
+    second = suggest_career_paths(resume, top_n=1)[0]
+    assert 'Tampered' not in second['education']
+    assert second['certifications']
+    assert second['salary_range']['formatted'] != 'Tampered'
+    assert second['experience_levels'].get('entry') != 'Tampered'
+
+def run_tests():
+    """Run all test cases."""
+    tests = [(name, func) for name, func in globals().items() if name.startswith('test_') and callable(func)]
+    failed = 0
+    for name, func in tests:
+        try:
+            func()
+            print(f"[PASS] {name}")
+        except Exception as e:
+            failed += 1
+            print(f"[FAIL] {name}: {e}")
+
+    print(f"\nPassed: {len(tests) - failed}/{len(tests)} tests")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,41 @@
+"""
+Regression tests for the job description matcher module.
+Run directly (python test_jd_matcher.py) or with pytest.
+"""
+import sys
+from pathlib import Path
+
+# Add the project root to the Python path
+sys.path.insert(0, str(Path(__file__).parent.absolute()))
+
+from modules.jd_matcher import match_resume_to_jd
+
+_ERROR_FEEDBACK = ["An error occurred while processing your resume. Please try again."]
+
+def test_keyword_match_returns_percentage():
+    """Matching used to hit a NameError on feedback and scale the score by 100 twice."""
+    resume = "Python developer experienced with Django, PostgreSQL and Docker deployments."
+    jd = "We need a Python developer with Django, Kubernetes, Terraform and AWS experience."
+    result = match_resume_to_jd(resume, jd, use_semantic_matching=False)
+
+    assert result.feedback != _ERROR_FEEDBACK
+    assert 0 < result.match_score < 100
+    assert 'python' in result.keyword_overlap
+
+def run_tests():
+    """Run all test cases."""
+    tests = [(name, func) for name, func in globals().items() if name.startswith('test_') and callable(func)]
+    failed = 0
+    for name, func in tests:
+        try:
+            func()
+            print(f"[PASS] {name}")
+        except Exception as e:
+            failed += 1
+            print(f"[FAIL] {name}: {e}")
+
+    print(f"\nPassed: {len(tests) - failed}/{len(tests)} tests")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    run_tests()